@@ -2,14 +2,98 @@
 Playwright browser management for async web scraping.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Dict, List, Optional
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 logger = logging.getLogger(__name__)
 
+# Chromium flags that trim per-page memory and launch time for headless scraping
+CHROMIUM_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-accelerated-2d-canvas",
+    "--disable-extensions",
+    "--no-zygote",
+    "--no-sandbox",
+]
+
+# Resources no scraper parses; aborting them saves bandwidth and memory.
+# Stylesheets are kept since some SPA sources rely on layout for rendering.
+BLOCKED_RESOURCES = "**/*.{png,jpg,jpeg,gif,webp,svg,ico,woff,woff2,ttf,mp4,webm}"
+
+# Default navigation timeout (ms) for page.goto calls without an explicit timeout
+NAVIGATION_TIMEOUT = 15000
+
+# Navigations a pooled page serves before it is closed and replaced
+PAGE_MAX_USES = 50
+
+
+class PagePool:
+    """
+    Bounded pool of pages in one browser context.
+
+    At most `size` pages exist at once; they are opened lazily, reused
+    across acquire() calls, and closed after `max_uses` leases so long
+    runs do not accumulate per-page memory.
+    """
+
+    def __init__(
+        self, context: BrowserContext, size: int, max_uses: int = PAGE_MAX_USES
+    ):
+        """
+        Initialize page pool.
+
+        Args:
+            context: Browser context the pages are opened in
+            size: Maximum number of pages leased at the same time
+            max_uses: Leases after which a page is closed and replaced
+        """
+        self.context = context
+        self.max_uses = max_uses
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[Page] = []
+        self._uses: Dict[Page, int] = {}
+
+    @asynccontextmanager
+    async def acquire(self) -> Page:
+        """
+        Lease a page, waiting for a free slot if all pages are in use.
+
+        Usage:
+            async with pool.acquire() as page:
+                await page.goto(url)
+        """
+        async with self._slots:
+            page = self._idle.pop() if self._idle else await self.context.new_page()
+            try:
+                yield page
+            finally:
+                uses = self._uses.pop(page, 0) + 1
+                if uses >= self.max_uses or page.is_closed():
+                    await self._close_page(page)
+                else:
+                    self._uses[page] = uses
+                    self._idle.append(page)
+
+    async def close(self):
+        """Close every idle page (call once no leases are outstanding)."""
+        while self._idle:
+            page = self._idle.pop()
+            self._uses.pop(page, None)
+            await self._close_page(page)
+
+    @staticmethod
+    async def _close_page(page: Page):
+        """Close a page, logging rather than raising on failure."""
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing page: {e}")
+
 
 class BrowserManager:
     """Manages Playwright browser instances for scraping."""
@@ -19,6 +103,7 @@ class BrowserManager:
         headless: bool = True,
         slow_mo: int = 0,
         timeout: int = 30000,
+        max_concurrent: int = 5,
     ):
         """
         Initialize browser manager.
@@ -27,12 +112,16 @@ class BrowserManager:
             headless: Run browser in headless mode
             slow_mo: Slow down operations by this many milliseconds
             timeout: Default timeout for operations in milliseconds
+            max_concurrent: Number of browser contexts kept in the pool
         """
         self.headless = headless
         self.slow_mo = slow_mo
         self.timeout = timeout
+        self.max_concurrent = max_concurrent
         self._playwright = None
         self._browser: Optional[Browser] = None
+        self._contexts: List[BrowserContext] = []
+        self._context_pool: Optional["asyncio.Queue[BrowserContext]"] = None
 
     async def start(self):
         """Initialize Playwright and launch browser."""
@@ -41,12 +130,32 @@ class BrowserManager:
         self._browser = await self._playwright.chromium.launch(
             headless=self.headless,
             slow_mo=self.slow_mo,
+            args=CHROMIUM_ARGS,
+            chromium_sandbox=False,
+        )
+
+        # Create the context pool once; pages lease a context and return it
+        self._context_pool = asyncio.Queue(maxsize=self.max_concurrent)
+        for _ in range(self.max_concurrent):
+            context = await self._new_context()
+            self._contexts.append(context)
+            self._context_pool.put_nowait(context)
+
+        logger.info(
+            f"Browser started (headless={self.headless}, "
+            f"contexts={self.max_concurrent})"
         )
-        logger.info(f"Browser started (headless={self.headless})")
 
     async def stop(self):
         """Clean up browser and Playwright."""
         logger.info("Stopping browser...")
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser context: {e}")
+        self._contexts = []
+        self._context_pool = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -55,15 +164,8 @@ class BrowserManager:
             self._playwright = None
         logger.info("Browser stopped")
 
-    @asynccontextmanager
-    async def new_page(self) -> Page:
-        """
-        Create a new browser page with default settings.
-
-        Usage:
-            async with browser_manager.new_page() as page:
-                await page.goto(url)
-        """
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with default settings."""
         context: BrowserContext = await self._browser.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent=(
@@ -71,14 +173,37 @@ class BrowserManager:
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/120.0.0.0 Safari/537.36"
             ),
+            ignore_https_errors=True,
         )
         context.set_default_timeout(self.timeout)
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+        await context.route(BLOCKED_RESOURCES, lambda route: route.abort())
+        return context
+
+    @asynccontextmanager
+    async def new_page(self) -> Page:
+        """
+        Lease a page from the shared context pool.
 
-        page = await context.new_page()
+        Blocks until a context is free. The page is closed on exit and its
+        context is returned to the pool; contexts are only closed in stop().
+
+        Usage:
+            async with browser_manager.new_page() as page:
+                await page.goto(url)
+        """
+        context = await self._context_pool.get()
+        page = None
         try:
+            page = await context.new_page()
             yield page
         finally:
-            await context.close()
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.debug(f"Error closing page: {e}")
+            self._context_pool.put_nowait(context)
 
     async def __aenter__(self):
         """Async context manager entry."""
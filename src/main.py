@@ -4,27 +4,51 @@ Orchestrates the scraping process across all configured sources.
 """
 
 import asyncio
+import copy
+import functools
 import logging
+import multiprocessing
+import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 import yaml
-import pytz
 
 import re
 
 from src.core.browser import BrowserManager
 from src.core.exceptions import ScraperException
 from src.models.event import Event, LocationType
+from src.models.source_result import SourceResult
 from src.parsers.date_parser import DateParser
-from src.output.html_generator import HTMLGenerator
+from src.output.html_generator import HTMLGenerator, render_page
 from src.utils.logging_config import setup_logging
+from src.utils.scrape_cache import DetailPageCache, ScrapeCache
 from src.scrapers import get_scraper_class
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime: float) -> Any:
+    """Parse a YAML file; cached per (path, mtime) so edits invalidate it."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_yaml(path: str) -> Any:
+    """Load a YAML file, returning a private copy of the cached parse."""
+    return copy.deepcopy(_parse_yaml(path, os.path.getmtime(path)))
+
+
 class EventScraperApp:
     """Main application class orchestrating the scraping process."""
 
@@ -39,9 +63,11 @@ class EventScraperApp:
         self.all_sources = self._load_all_sources("config/sources.yaml")
         self.sources = [s for s in self.all_sources if s.get("enabled", True)]
         self.browser_manager = None
+        self.cache: Optional[ScrapeCache] = None
+        self.detail_cache: Optional[DetailPageCache] = None
         self.events: List[Event] = []
-        self.errors: Dict[str, str] = {}
-        self.source_results: List[Dict[str, Any]] = []
+        self.source_results: List[SourceResult] = []
+        self.use_cache = True  # Read cached results; fresh scrapes are always cached
 
         setup_logging(
             level=self.config["logging"]["level"],
@@ -50,14 +76,11 @@ class EventScraperApp:
 
     def _load_config(self, path: str) -> Dict[str, Any]:
         """Load main configuration."""
-        with open(path, "r") as f:
-            return yaml.safe_load(f)
+        return _load_yaml(path)
 
     def _load_all_sources(self, path: str) -> List[Dict[str, Any]]:
         """Load all source definitions."""
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
-            return data["sources"]
+        return _load_yaml(path)["sources"]
 
     def _get_date_range(self) -> tuple:
         """Get the date range for filtering events."""
@@ -87,137 +110,168 @@ class EventScraperApp:
             f"{date_range[1].strftime('%Y-%m-%d')}"
         )
 
+        scraping_config = self.config["scraping"]
+        self.cache = ScrapeCache(
+            directory=scraping_config.get("cache_dir", "cache"),
+            ttl=scraping_config.get("cache_ttl_sec", 3600),
+        )
+        if self.use_cache:
+            self.detail_cache = DetailPageCache(
+                directory=scraping_config.get("cache_dir", "cache"),
+                ttl=scraping_config.get("detail_cache_ttl_sec", 86400),
+            )
+
         # Initialize browser
         self.browser_manager = BrowserManager(
             headless=self.config["browser"]["headless"],
             slow_mo=self.config["browser"]["slow_mo"],
             timeout=self.config["browser"]["timeout"],
+            max_concurrent=self.config["scraping"]["max_concurrent"],
         )
         await self.browser_manager.start()
 
         try:
-            # Scrape all sources with concurrency control
-            semaphore = asyncio.Semaphore(
-                self.config["scraping"]["max_concurrent"]
-            )
-
+            # Scrape all sources; the browser context pool bounds concurrency
             tasks = [
-                self._scrape_source(source, semaphore) for source in self.sources
+                asyncio.create_task(self._scrape_source_safe(source))
+                for source in self.sources
             ]
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            source_events_map: Dict[str, List[Event]] = {}
-            for source, result in zip(self.sources, results):
-                if isinstance(result, Exception):
-                    self.errors[source["name"]] = str(result)
-                    logger.error(f"Failed to scrape {source['name']}: {result}")
-                    source_events_map[source["name"]] = []
-                elif result:
-                    self.events.extend(result)
-                    source_events_map[source["name"]] = result
-                else:
-                    source_events_map[source["name"]] = []
-
-            # Filter by date range
-            filtered_events = [
-                e
-                for e in self.events
-                if e.is_within_date_range(date_range[0], date_range[1])
-            ]
-
-            # Filter out in-person international conferences
-            filtered_events = [
-                e for e in filtered_events
-                if not self._is_inperson_international_conference(e)
-            ]
-
-            # Build per-source results for status page
-            for source in self.all_sources:
+            # Process results as each source finishes
+            start_ts, end_ts = date_range[0].timestamp(), date_range[1].timestamp()
+            scraped: Dict[str, SourceResult] = {}
+            kept_by_source: Dict[str, List[Event]] = {}
+            for next_done in asyncio.as_completed(tasks):
+                source, result, error = await next_done
                 name = source["name"]
-                enabled = source.get("enabled", True)
-                if not enabled:
-                    self.source_results.append({
-                        "name": name,
-                        "url": source.get("url", ""),
-                        "enabled": False,
-                        "status": "disabled",
-                        "total_events": 0,
-                        "in_range_events": 0,
-                        "error_message": None,
-                    })
-                elif name in self.errors:
-                    self.source_results.append({
-                        "name": name,
-                        "url": source.get("url", ""),
-                        "enabled": True,
-                        "status": "error",
-                        "total_events": 0,
-                        "in_range_events": 0,
-                        "error_message": self.errors[name],
-                    })
-                else:
-                    src_events = source_events_map.get(name, [])
-                    in_range = [
-                        e for e in src_events
-                        if e.is_within_date_range(date_range[0], date_range[1])
-                    ]
-                    self.source_results.append({
-                        "name": name,
-                        "url": source.get("url", ""),
-                        "enabled": True,
-                        "status": "success",
-                        "total_events": len(src_events),
-                        "in_range_events": len(in_range),
-                        "error_message": None,
-                    })
+                if error is not None:
+                    logger.error(f"Failed to scrape {name}: {error}")
+                    scraped[name] = SourceResult(
+                        name=name,
+                        url=source.get("url", ""),
+                        status="error",
+                        error_message=str(error),
+                    )
+                    continue
+
+                src_events = result or []
+                in_range = [
+                    e for e in src_events if e.is_within_timestamps(start_ts, end_ts)
+                ]
+                self.events.extend(src_events)
+                # Drop in-person international conferences in the same pass
+                kept_by_source[name] = [
+                    e for e in in_range
+                    if not self._is_inperson_international_conference(e)
+                ]
+                scraped[name] = SourceResult(
+                    name=name,
+                    url=source.get("url", ""),
+                    total_events=len(src_events),
+                    in_range_events=len(in_range),
+                )
+
+            # Drop events already listed by an earlier source (config order)
+            seen: Set[Tuple[str, int]] = set()
+            filtered_events: List[Event] = []
+            for source in self.sources:
+                name = source["name"]
+                for e in kept_by_source.get(name, ()):
+                    key = e.fingerprint()
+                    if key in seen:
+                        scraped[name].duplicates_removed += 1
+                        continue
+                    seen.add(key)
+                    filtered_events.append(e)
+
+            # Per-source results for status page, in config order
+            self.source_results = [
+                scraped.get(source["name"])
+                or SourceResult(
+                    name=source["name"],
+                    url=source.get("url", ""),
+                    enabled=source.get("enabled", True),
+                    status="success" if source.get("enabled", True) else "disabled",
+                )
+                for source in self.all_sources
+            ]
 
+            # One summary line instead of per-source progress logging
+            summary = ", ".join(
+                f"{r.name}={r.total_events}"
+                for r in self.source_results
+                if r.status == "success" and r.name in scraped
+            )
+            logger.info(f"Events per source: {summary}")
             logger.info(
                 f"Scraped {len(self.events)} total events, "
                 f"{len(filtered_events)} within date range"
             )
 
-            # Generate output
-            days_ahead = self.config["date_range"].get("days_ahead", 14)
-            self._generate_output(filtered_events, date_range, days_ahead)
-
-            return filtered_events
-
         finally:
             await self.browser_manager.stop()
 
-    async def _scrape_source(
-        self,
-        source: Dict[str, Any],
-        semaphore: asyncio.Semaphore,
-    ) -> List[Event]:
+        # Generate output once the browser is gone, so render workers never
+        # inherit the Playwright driver or the running event loop
+        days_ahead = self.config["date_range"].get("days_ahead", 14)
+        self._generate_output(filtered_events, date_range, days_ahead)
+
+        return filtered_events
+
+    async def _scrape_source(self, source: Dict[str, Any]) -> List[Event]:
         """
-        Scrape a single source with semaphore control.
+        Scrape a single source.
+
+        Concurrency is bounded by the browser manager's context pool:
+        new_page() blocks until a context is free.
 
         Args:
             source: Source configuration dict
-            semaphore: Asyncio semaphore for concurrency control
 
         Returns:
             List of events from the source
         """
-        async with semaphore:
-            logger.info(f"Scraping {source['name']}")
-
-            try:
-                scraper_class = get_scraper_class(source["scraper"])
-
-                async with self.browser_manager.new_page() as page:
-                    scraper = scraper_class(page)
-                    events = await scraper.scrape()
+        if self.use_cache:
+            cached = self.cache.get(source["name"])
+            if cached is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Using {len(cached)} cached events for {source['name']}"
+                    )
+                return cached
 
-                logger.info(f"Found {len(events)} events from {source['name']}")
-                return events
+        try:
+            scraper_class = get_scraper_class(source["scraper"])
+
+            async with self.browser_manager.new_page() as page:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Scraping {source['name']}")
+                scraper = scraper_class(page, detail_cache=self.detail_cache)
+                events = await scraper.scrape()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Found {len(events)} events from {source['name']}")
+            if events:
+                self.cache.put(source["name"], events)
+            return events
+
+        except Exception as e:
+            logger.error(f"Error scraping {source['name']}: {e}")
+            raise
+
+    async def _scrape_source_safe(
+        self, source: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[List[Event]], Optional[Exception]]:
+        """
+        Scrape a source, returning the outcome tagged with its source.
 
-            except Exception as e:
-                logger.error(f"Error scraping {source['name']}: {e}")
-                raise
+        Returns:
+            Tuple of (source, events, error); exactly one of events/error is set
+        """
+        try:
+            return source, await self._scrape_source(source), None
+        except Exception as e:
+            return source, None, e
 
     def _generate_output(
         self, events: List[Event], date_range: tuple, days_ahead: int = 14
@@ -227,22 +281,44 @@ class EventScraperApp:
         output_dir = Path(output_config["directory"])
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Sort once; the generator skips re-sorting already ordered lists
+        events = sorted(events, key=attrgetter("start_ts"))
+
         generator = HTMLGenerator()
         total_sources = len(self.all_sources)
 
-        # Generate HTML
+        # Generate HTML and export pages; large runs render them in parallel
+        # worker processes since templating and JSON encoding are CPU-bound
         html_path = output_dir / output_config["html_file"]
-        generator.generate(events, str(html_path), date_range, total_sources=total_sources)
-        logger.info(f"Generated HTML: {html_path}")
-
-        # Generate export page
         export_path = output_dir / "export.html"
-        generator.generate_export_page(events, str(export_path), date_range, days_ahead)
+        event_pages = [
+            ("generate", (events, str(html_path), date_range, total_sources)),
+            ("generate_export_page", (events, str(export_path), date_range, days_ahead)),
+        ]
+        if len(events) > output_config.get("parallel_render_threshold", 500):
+            # Spawned workers start clean rather than forking this process;
+            # they stamp pages with this generator's timestamp
+            with ProcessPoolExecutor(
+                max_workers=len(event_pages),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = [
+                    pool.submit(render_page, method, generator.generated_at, *args)
+                    for method, args in event_pages
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for method, args in event_pages:
+                getattr(generator, method)(*args)
+        logger.info(f"Generated HTML: {html_path}")
         logger.info(f"Generated export page: {export_path}")
 
         # Generate status page
         status_path = output_dir / "status.html"
-        generator.generate_status_page(self.source_results, str(status_path), date_range)
+        generator.generate_status_page(
+            [r.to_dict() for r in self.source_results], str(status_path), date_range
+        )
         logger.info(f"Generated status page: {status_path}")
 
         # Generate feedback page
@@ -263,10 +339,11 @@ class EventScraperApp:
             logger.info(f"Generated text: {text_path}")
 
         # Log any errors
-        if self.errors:
-            logger.warning(f"Errors occurred for {len(self.errors)} sources:")
-            for source, error in self.errors.items():
-                logger.warning(f"  {source}: {error}")
+        failed = [r for r in self.source_results if r.status == "error"]
+        if failed:
+            logger.warning(f"Errors occurred for {len(failed)} sources:")
+            for result in failed:
+                logger.warning(f"  {result.name}: {result.error_message}")
 
     @staticmethod
     def _is_inperson_international_conference(event: Event) -> bool:
@@ -309,6 +386,11 @@ def main():
         action="store_true",
         help="Enable debug mode (non-headless browser)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached scrape results and re-scrape every source",
+    )
     parser.add_argument(
         "--source",
         type=str,
@@ -323,6 +405,9 @@ def main():
         app.config["browser"]["headless"] = False
         app.config["logging"]["level"] = "DEBUG"
 
+    if args.no_cache:
+        app.use_cache = False
+
     if args.source:
         # Filter to only the specified source
         app.sources = [s for s in app.sources if s["name"] == args.source]
@@ -330,7 +415,15 @@ def main():
             print(f"Source '{args.source}' not found or not enabled")
             return
 
-    asyncio.run(app.run())
+    try:
+        import uvloop
+    except ImportError:  # Not installed or unsupported platform (Windows)
+        uvloop = None
+
+    if uvloop is not None:
+        uvloop.run(app.run())
+    else:
+        asyncio.run(app.run())
 
 
 if __name__ == "__main__":
@@ -2,11 +2,24 @@
 Event data model with validation and PST normalization.
 """
 
+import unicodedata
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timezone
+from typing import Optional, Tuple
 from enum import Enum
-import pytz
+from zoneinfo import ZoneInfo
+
+from src.parsers.regex_patterns import MONTH_NAMES
+
+PST = ZoneInfo("America/Los_Angeles")
+
+# Events from different sources starting within the same bucket are duplicates
+FINGERPRINT_BUCKET_SECONDS = 1800
+
+
+def _format_clock(dt: datetime) -> str:
+    """Format as 12-hour 'H:MM' without a leading zero (like '%I:%M'.lstrip('0'))."""
+    return f"{dt.hour % 12 or 12}:{dt.minute:02d}"
 
 
 class LocationType(Enum):
@@ -16,7 +29,7 @@ class LocationType(Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Represents a single event with all extracted information."""
 
@@ -30,51 +43,65 @@ class Event:
     end_datetime: Optional[datetime] = None
 
     # Optional details
-    speakers: List[str] = field(default_factory=list)
+    speakers: Tuple[str, ...] = ()  # Lists are accepted and converted
     location_type: LocationType = LocationType.UNKNOWN
     location_details: Optional[str] = None  # City/venue for in-person
     cost: Optional[str] = None  # "free", "$50", "$100-$200"
     description: Optional[str] = None
 
     # Metadata
-    scraped_at: datetime = field(default_factory=lambda: datetime.now(pytz.UTC))
+    scraped_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     raw_date_text: Optional[str] = None  # Original date text for debugging
 
+    # Cached epoch timestamp of start_datetime for fast range checks
+    start_ts: float = field(init=False, repr=False, compare=False, default=0.0)
+    # Cached display string built once from the PST-normalized datetimes
+    _date_range_text: str = field(init=False, repr=False, compare=False, default="")
+    # Cached "YYYY-MM-DD" of start_datetime for grouping by day
+    date_key: str = field(init=False, repr=False, compare=False, default="")
+
     def __post_init__(self):
         """Validate and normalize after initialization."""
         self.title = self.title.strip() if self.title else ""
         self.url = self.url.strip() if self.url else ""
-        self.speakers = [s.strip() for s in self.speakers if s and s.strip()]
+        self.speakers = tuple(s.strip() for s in self.speakers if s and s.strip())
 
         # Ensure datetime is timezone-aware PST
-        pst = pytz.timezone("America/Los_Angeles")
         if self.start_datetime.tzinfo is None:
-            self.start_datetime = pst.localize(self.start_datetime)
+            self.start_datetime = self.start_datetime.replace(tzinfo=PST)
         else:
-            self.start_datetime = self.start_datetime.astimezone(pst)
+            self.start_datetime = self.start_datetime.astimezone(PST)
+        self.start_ts = self.start_datetime.timestamp()
+        start = self.start_datetime
+        self.date_key = f"{start.year:04d}-{start.month:02d}-{start.day:02d}"
 
         if self.end_datetime:
             if self.end_datetime.tzinfo is None:
-                self.end_datetime = pst.localize(self.end_datetime)
+                self.end_datetime = self.end_datetime.replace(tzinfo=PST)
             else:
-                self.end_datetime = self.end_datetime.astimezone(pst)
+                self.end_datetime = self.end_datetime.astimezone(PST)
 
-    def format_date_range(self) -> str:
-        """Format date/time for display output."""
-        pst = pytz.timezone("America/Los_Angeles")
-        start = self.start_datetime.astimezone(pst)
+        self._date_range_text = self._build_date_range_text()
 
-        date_str = start.strftime("%B %d, %Y")
-        start_time = start.strftime("%I:%M").lstrip("0")
-        start_ampm = start.strftime("%p").lower()
+    def _build_date_range_text(self) -> str:
+        """Build the display date/time string from PST-normalized datetimes."""
+        start = self.start_datetime.astimezone(PST)
+
+        date_str = f"{MONTH_NAMES[start.month - 1]} {start.day:02d}, {start.year}"
+        start_time = _format_clock(start)
+        start_ampm = "pm" if start.hour >= 12 else "am"
 
         if self.end_datetime:
-            end = self.end_datetime.astimezone(pst)
-            end_time = end.strftime("%I:%M%p").lstrip("0").lower()
-            return f"{date_str}, {start_time}-{end_time} PST"
+            end = self.end_datetime.astimezone(PST)
+            end_ampm = "pm" if end.hour >= 12 else "am"
+            return f"{date_str}, {start_time}-{_format_clock(end)}{end_ampm} PST"
         else:
             return f"{date_str}, {start_time}{start_ampm} PST"
 
+    def format_date_range(self) -> str:
+        """Format date/time for display output."""
+        return self._date_range_text
+
     def format_cost(self) -> str:
         """Format cost for display."""
         if not self.cost or self.cost.lower() in ["free", "0", "$0", "$0.00"]:
@@ -106,16 +133,29 @@ class Event:
 
     def is_within_date_range(self, start_date: datetime, end_date: datetime) -> bool:
         """Check if event falls within the specified date range."""
-        pst = pytz.timezone("America/Los_Angeles")
-
         # Ensure comparison dates are timezone-aware
         if start_date.tzinfo is None:
-            start_date = pst.localize(start_date)
+            start_date = start_date.replace(tzinfo=PST)
         if end_date.tzinfo is None:
-            end_date = pst.localize(end_date)
+            end_date = end_date.replace(tzinfo=PST)
+
+        return self.is_within_timestamps(start_date.timestamp(), end_date.timestamp())
+
+    def is_within_timestamps(self, start_ts: float, end_ts: float) -> bool:
+        """Check if event falls within a range given as epoch timestamps."""
+        return start_ts <= self.start_ts <= end_ts
+
+    def fingerprint(self) -> Tuple[str, int]:
+        """
+        Key identifying the same event listed by different sources.
 
-        return start_date <= self.start_datetime <= end_date
+        Start times share a key only within the same fixed 30-minute bucket
+        (12:00-12:29, 12:30-12:59, ...), not within 30 minutes of each
+        other: 12:29 and 12:31 never match.
+        """
+        title = unicodedata.normalize("NFKD", self.title).casefold()
+        return " ".join(title.split()), int(self.start_ts // FINGERPRINT_BUCKET_SECONDS)
 
     def __lt__(self, other: "Event") -> bool:
         """Enable sorting by start datetime."""
-        return self.start_datetime < other.start_datetime
+        return self.start_ts < other.start_ts
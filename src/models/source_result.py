@@ -0,0 +1,24 @@
+"""
+Per-source scrape outcome used for the status page.
+"""
+
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class SourceResult:
+    """Scraping outcome for a single configured source."""
+
+    name: str
+    url: str = ""
+    enabled: bool = True
+    status: str = "success"  # "success", "error", or "disabled"
+    total_events: int = 0
+    in_range_events: int = 0
+    duplicates_removed: int = 0  # In-range events already listed by another source
+    error_message: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict shape consumed by the status page template."""
+        return asdict(self)
@@ -2,15 +2,16 @@
 Static HTML and text output generation from scraped events.
 """
 
-import json
 import re
+from itertools import groupby
+from operator import attrgetter
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
-import pytz
-from jinja2 import Environment, FileSystemLoader
+import orjson
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
-from src.models.event import Event
+from src.models.event import Event, PST
 
 
 def days_to_time_period(days: int) -> str:
@@ -46,9 +47,36 @@ def days_to_time_period(days: int) -> str:
         return f"{days} days"
 
 
+def render_page(method: str, generated_at: str, *args) -> str:
+    """
+    Render one page with a fresh HTMLGenerator.
+
+    Module-level so it can be submitted to a ProcessPoolExecutor.
+
+    Args:
+        method: Name of the HTMLGenerator generate* method to call
+        generated_at: Generation timestamp shared with the caller's pages
+        *args: Positional arguments for that method
+
+    Returns:
+        Path to generated file
+    """
+    generator = HTMLGenerator()
+    generator.generated_at = generated_at
+    return getattr(generator, method)(*args)
+
+
 class HTMLGenerator:
     """Generate static HTML and text output from events."""
 
+    TEMPLATE_NAMES = (
+        "events.html.j2",
+        "export.html.j2",
+        "status.html.j2",
+        "feedback.html.j2",
+        "changelog.html.j2",
+    )
+
     def __init__(self, template_dir: str = None):
         """
         Initialize HTML generator.
@@ -62,7 +90,16 @@ class HTMLGenerator:
         self.env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
             autoescape=True,
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache(),
         )
+        # Compile every page template once up front
+        self.templates = {
+            name: self.env.get_template(name) for name in self.TEMPLATE_NAMES
+        }
+
+        # All pages from one generator share a single generation timestamp
+        self.generated_at = datetime.now(PST).strftime("%Y-%m-%d %H:%M:%S PST")
 
     def generate(
         self,
@@ -84,17 +121,16 @@ class HTMLGenerator:
             Path to generated file
         """
         # Sort events by date
-        sorted_events = sorted(events, key=lambda e: e.start_datetime)
+        sorted_events = self._sorted_by_start(events)
 
         # Group by date for display
         grouped_events = self._group_by_date(sorted_events)
 
         # Prepare template context
-        pst = pytz.timezone("America/Los_Angeles")
         context = {
             "events": sorted_events,
             "grouped_events": grouped_events,
-            "generated_at": datetime.now(pst).strftime("%Y-%m-%d %H:%M:%S PST"),
+            "generated_at": self.generated_at,
             "total_events": len(events),
             "total_sources": total_sources,
             "date_range_start": (
@@ -105,16 +141,7 @@ class HTMLGenerator:
             ),
         }
 
-        # Render template
-        template = self.env.get_template("events.html.j2")
-        html_content = template.render(**context)
-
-        # Write to file
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html_content, encoding="utf-8")
-
-        return str(output_file)
+        return self._render_to_file("events.html.j2", context, output_path)
 
     def generate_text_output(
         self,
@@ -133,7 +160,7 @@ class HTMLGenerator:
         Returns:
             Formatted text string
         """
-        sorted_events = sorted(events, key=lambda e: e.start_datetime)
+        sorted_events = self._sorted_by_start(events)
 
         lines = []
 
@@ -176,10 +203,10 @@ class HTMLGenerator:
             Path to generated file
         """
         # Sort events by date
-        sorted_events = sorted(events, key=lambda e: e.start_datetime)
+        sorted_events = self._sorted_by_start(events)
 
         # Create JSON-serializable event data for JavaScript
-        events_json = json.dumps(
+        events_json = orjson.dumps(
             [
                 {
                     "title": e.title,
@@ -191,21 +218,19 @@ class HTMLGenerator:
                     "cost": e.format_cost(),
                 }
                 for e in sorted_events
-            ],
-            ensure_ascii=False,
-        )
+            ]
+        ).decode("utf-8")
 
         # Get unique sources for filter dropdown
         sources = sorted(set(e.source for e in sorted_events))
 
         # Prepare template context
-        pst = pytz.timezone("America/Los_Angeles")
         time_period = days_to_time_period(days_ahead)
         context = {
             "events": sorted_events,
             "events_json": events_json,
             "sources": sources,
-            "generated_at": datetime.now(pst).strftime("%Y-%m-%d %H:%M:%S PST"),
+            "generated_at": self.generated_at,
             "total_events": len(events),
             "date_range_start": (
                 date_range[0].strftime("%B %d, %Y") if date_range else None
@@ -216,16 +241,7 @@ class HTMLGenerator:
             "time_period": time_period,
         }
 
-        # Render template
-        template = self.env.get_template("export.html.j2")
-        html_content = template.render(**context)
-
-        # Write to file
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html_content, encoding="utf-8")
-
-        return str(output_file)
+        return self._render_to_file("export.html.j2", context, output_path)
 
     def generate_status_page(
         self,
@@ -257,14 +273,13 @@ class HTMLGenerator:
             key=lambda s: (status_order.get(s["status"], 1), s["name"]),
         )
 
-        pst = pytz.timezone("America/Los_Angeles")
         context = {
             "source_results": sorted_results,
             "total_sources": total,
             "enabled_sources": enabled,
             "successful_sources": successful,
             "failed_sources": failed,
-            "generated_at": datetime.now(pst).strftime("%Y-%m-%d %H:%M:%S PST"),
+            "generated_at": self.generated_at,
             "date_range_start": (
                 date_range[0].strftime("%B %d, %Y") if date_range else None
             ),
@@ -273,14 +288,7 @@ class HTMLGenerator:
             ),
         }
 
-        template = self.env.get_template("status.html.j2")
-        html_content = template.render(**context)
-
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html_content, encoding="utf-8")
-
-        return str(output_file)
+        return self._render_to_file("status.html.j2", context, output_path)
 
     def generate_feedback_page(self, output_path: str) -> str:
         """
@@ -292,19 +300,11 @@ class HTMLGenerator:
         Returns:
             Path to generated file
         """
-        pst = pytz.timezone("America/Los_Angeles")
         context = {
-            "generated_at": datetime.now(pst).strftime("%Y-%m-%d %H:%M:%S PST"),
+            "generated_at": self.generated_at,
         }
 
-        template = self.env.get_template("feedback.html.j2")
-        html_content = template.render(**context)
-
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html_content, encoding="utf-8")
-
-        return str(output_file)
+        return self._render_to_file("feedback.html.j2", context, output_path)
 
     def generate_changelog_page(
         self, output_path: str, patch_md_path: str = None
@@ -324,18 +324,34 @@ class HTMLGenerator:
 
         versions = self._parse_patch_md(Path(patch_md_path))
 
-        pst = pytz.timezone("America/Los_Angeles")
         context = {
             "versions": versions,
-            "generated_at": datetime.now(pst).strftime("%Y-%m-%d %H:%M:%S PST"),
+            "generated_at": self.generated_at,
         }
 
-        template = self.env.get_template("changelog.html.j2")
-        html_content = template.render(**context)
+        return self._render_to_file("changelog.html.j2", context, output_path)
 
+    def _render_to_file(
+        self, template_name: str, context: Dict, output_path: str
+    ) -> str:
+        """
+        Render a page template straight to disk.
+
+        The template is streamed into the file chunk by chunk, so the full
+        page never exists as one string in memory.
+
+        Args:
+            template_name: Name of a template in TEMPLATE_NAMES
+            context: Template context
+            output_path: Path to write HTML file
+
+        Returns:
+            Path to generated file
+        """
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html_content, encoding="utf-8")
+        with output_file.open("w", encoding="utf-8") as f:
+            self.templates[template_name].stream(**context).dump(f)
 
         return str(output_file)
 
@@ -401,12 +417,16 @@ class HTMLGenerator:
 
         return versions
 
+    @staticmethod
+    def _sorted_by_start(events: List[Event]) -> List[Event]:
+        """Return events sorted by start time, skipping the sort if already in order."""
+        if all(a.start_ts <= b.start_ts for a, b in zip(events, events[1:])):
+            return events
+        return sorted(events, key=attrgetter("start_ts"))
+
     def _group_by_date(self, events: List[Event]) -> Dict[str, List[Event]]:
-        """Group events by date for organized display."""
-        grouped = {}
-        for event in events:
-            date_key = event.start_datetime.strftime("%Y-%m-%d")
-            if date_key not in grouped:
-                grouped[date_key] = []
-            grouped[date_key].append(event)
-        return grouped
+        """Group date-sorted events by day for organized display."""
+        return {
+            date_key: list(group)
+            for date_key, group in groupby(events, key=attrgetter("date_key"))
+        }
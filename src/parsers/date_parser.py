@@ -3,20 +3,87 @@ Date parsing and timezone normalization utilities.
 Handles various date formats from different event sources.
 """
 
-from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, Tuple, Optional
 import re
-import pytz
+from zoneinfo import ZoneInfo
 from dateutil import parser as dateutil_parser
 
+# Text normalization: any whitespace run (NBSP included) -> one space; en/em dash -> "-"
+_WS_RE = re.compile(r"\s+")
+_DASH_TRANS = str.maketrans({"\u2013": "-", "\u2014": "-"})
+
+# Every time token in one alternation, tried in priority order at each position:
+# "1:00 pm-1:50 pm" / "13:00-14:00", then "1:00pm", then "1-2pm"
+_TIME_TOKEN_RE = re.compile(
+    r"(?P<range>(?P<rh>\d{1,2}):(?P<rm>\d{2})\s*(?P<ra>[ap]m)?\s*[-\u2013]\s*"
+    r"(?P<reh>\d{1,2}):(?P<rem>\d{2})\s*(?P<rea>[ap]m)?)"
+    r"|(?P<single>(?P<sh>\d{1,2}):(?P<sm>\d{2})\s*(?P<sa>[ap]m))"
+    r"|(?P<hours>(?P<hh>\d{1,2})\s*(?P<ha>[ap]m)?\s*[-\u2013]\s*(?P<heh>\d{1,2})\s*(?P<hea>[ap]m))",
+    re.IGNORECASE,
+)
+_TIME_TOKEN_PRIORITY = ("range", "single", "hours")
+
+# (hour, "am"/"pm"/None) -> 24-hour clock hour for every hour \d{1,2} can capture;
+# out-of-range results (e.g. "13pm" -> 25) are kept so datetime still rejects them
+_HOUR_CONVERT = {
+    **{(h, None): h for h in range(100)},
+    **{(h, "am"): 0 if h == 12 else h for h in range(100)},
+    **{(h, "pm"): h if h == 12 else h + 12 for h in range(100)},
+}
+
+# Manual date fallbacks
+_DATE_MDY_WORD_RE = re.compile(r"(\w+)\s+(\d{1,2}),?\s+(\d{4})", re.IGNORECASE)
+_DATE_DMY_WORD_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})", re.IGNORECASE)
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_SLASH_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_MONTH_DAY_RE = re.compile(r"(\w{3,})\s+(\d{1,2})(?!\d)", re.IGNORECASE)
+# Any of the above in one scan: lets text with no fallback shape fail fast
+_FALLBACK_DATE_RE = re.compile(
+    "|".join(
+        f"(?:{pattern.pattern})"
+        for pattern in (
+            _DATE_MDY_WORD_RE,
+            _DATE_DMY_WORD_RE,
+            _ISO_DATE_RE,
+            _SLASH_DATE_RE,
+            _MONTH_DAY_RE,
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+class _LazyTZInfos(Mapping):
+    """Abbreviation -> ZoneInfo, loading each zone on first lookup."""
+
+    def __init__(self, names: Dict[str, str]):
+        self._names = names
+        self._zones = {}
+
+    def __getitem__(self, abbr: str) -> ZoneInfo:
+        zone = self._zones.get(abbr)
+        if zone is None:
+            zone = self._zones[abbr] = ZoneInfo(self._names[abbr])
+        return zone
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
 
 class DateParser:
     """Utility class for parsing and normalizing dates to PST."""
 
-    PST = pytz.timezone("America/Los_Angeles")
-    UTC = pytz.UTC
+    PST = ZoneInfo("America/Los_Angeles")
+    UTC = ZoneInfo("UTC")
 
-    # Common timezone abbreviations and their pytz names
+    # Common timezone abbreviations and their IANA zone names
     TIMEZONE_MAP = {
         "PST": "America/Los_Angeles",
         "PDT": "America/Los_Angeles",
@@ -40,45 +107,30 @@ class DateParser:
         "AKT": "US/Alaska",
     }
 
-    # Month name mappings
-    MONTHS = {
-        "jan": 1, "january": 1,
-        "feb": 2, "february": 2,
-        "mar": 3, "march": 3,
-        "apr": 4, "april": 4,
-        "may": 5,
-        "jun": 6, "june": 6,
-        "jul": 7, "july": 7,
-        "aug": 8, "august": 8,
-        "sep": 9, "sept": 9, "september": 9,
-        "oct": 10, "october": 10,
-        "nov": 11, "november": 11,
-        "dec": 12, "december": 12,
-    }
+    # Timezone objects resolved on first use and shared by every parse
+    _TZ_OBJECTS = _LazyTZInfos(TIMEZONE_MAP)
 
-    # Timezone info for dateutil parser
-    TZINFOS = {
-        "ET": pytz.timezone("America/New_York"),
-        "EST": pytz.timezone("America/New_York"),
-        "EDT": pytz.timezone("America/New_York"),
-        "PT": pytz.timezone("America/Los_Angeles"),
-        "PST": pytz.timezone("America/Los_Angeles"),
-        "PDT": pytz.timezone("America/Los_Angeles"),
-        "CT": pytz.timezone("America/Chicago"),
-        "CST": pytz.timezone("America/Chicago"),
-        "CDT": pytz.timezone("America/Chicago"),
-        "MT": pytz.timezone("America/Denver"),
-        "MST": pytz.timezone("America/Denver"),
-        "MDT": pytz.timezone("America/Denver"),
-        "GMT": pytz.UTC,
-        "UTC": pytz.UTC,
-        "CET": pytz.timezone("Europe/Paris"),
-        "CEST": pytz.timezone("Europe/Paris"),
-        "BST": pytz.timezone("Europe/London"),
-        "AKST": pytz.timezone("US/Alaska"),
-        "AKDT": pytz.timezone("US/Alaska"),
-        "AKT": pytz.timezone("US/Alaska"),
-    }
+    # Single scan of lowercased text for any abbreviation; when several appear,
+    # the earliest TIMEZONE_MAP entry wins (matching the former per-entry loop)
+    _TZ_RE = re.compile(
+        r"\b("
+        + "|".join(sorted((abbr.lower() for abbr in TIMEZONE_MAP), key=len, reverse=True))
+        + r")\b"
+    )
+    _TZ_PRIORITY = {abbr.lower(): i for i, abbr in enumerate(TIMEZONE_MAP)}
+
+    # Month lookup by lowercased 3-letter prefix (callers truncate with [:3])
+    MONTHS = MappingProxyType({
+        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    })
+
+    # Exact formats tried with strptime before falling back to dateutil
+    FAST_DATE_FORMATS = ("%Y-%m-%d", "%B %d, %Y", "%b %d, %Y", "%d %B %Y", "%m/%d/%Y")
+
+    # Timezone info for dateutil parser (same lazy mapping; dateutil only
+    # looks up abbreviations it actually finds in the text)
+    TZINFOS = _TZ_OBJECTS
 
     @classmethod
     def parse_datetime_range(
@@ -99,42 +151,53 @@ class DateParser:
         if not text:
             raise ValueError("Empty date text")
 
+        # Missing years/relative dates resolve against "today", so it is part of the key
+        return cls._parse_cached(text, reference_date, cls._today_key())
+
+    @classmethod
+    def _today_key(cls) -> Tuple[int, int]:
+        """Local and PST calendar day (dateutil and the manual fallback use each)."""
+        return date.today().toordinal(), datetime.now(cls.PST).toordinal()
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse_cached(
+        cls,
+        text: str,
+        reference_date: Optional[datetime],
+        today_key: Tuple[int, int],
+    ) -> Tuple[datetime, Optional[datetime]]:
+        """Memoized body of parse_datetime_range (results are immutable datetimes)."""
         text = cls._normalize_text(text)
 
+        # Without a single digit there is no day or year to anchor a date
+        if not any(ch.isdigit() for ch in text):
+            raise ValueError(f"No date digits in: {text}")
+
+        # Lowercase once; timezone detection and the date parsers all work on it
+        text_lower = text.lower()
+
         # Detect timezone in text BEFORE any modifications
-        source_tz = cls._detect_timezone(text)
-
-        # Extract time range BEFORE parsing (dateutil gets confused by time ranges)
-        start_time, end_time = cls._extract_time_range(text)
-
-        # Remove time range from text to avoid confusing dateutil
-        # Pattern: removes "1:00 pm-1:50 pm" or "1:00-1:50pm" type patterns
-        date_only_text = re.sub(
-            r"\d{1,2}:\d{2}\s*(?:am|pm)?\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm)?",
-            "",
-            text,
-            flags=re.IGNORECASE
-        )
-        # Also remove single times for cleaner parsing
-        date_only_text = re.sub(
-            r"\d{1,2}:\d{2}\s*(?:am|pm)",
-            "",
-            date_only_text,
-            flags=re.IGNORECASE
-        )
+        source_tz = cls._detect_timezone(text, text_lower)
+
+        # Extract times and strip them in one scan (dateutil gets confused by
+        # time ranges like "1:00 pm-1:50 pm")
+        start_time, end_time, date_only_text = cls._scan_time_tokens(text_lower)
 
-        # Try dateutil parser on cleaned text
+        # Try exact formats first, then the (much slower) fuzzy dateutil parser
         try:
-            parsed = dateutil_parser.parse(date_only_text, fuzzy=True, tzinfos=cls.TZINFOS)
+            parsed = cls._fast_parse_date(date_only_text) or dateutil_parser.parse(
+                date_only_text, fuzzy=True, tzinfos=cls.TZINFOS
+            )
             # Start with midnight in source timezone
-            start_dt = source_tz.localize(
-                datetime(parsed.year, parsed.month, parsed.day, 0, 0)
+            start_dt = datetime(
+                parsed.year, parsed.month, parsed.day, 0, 0, tzinfo=source_tz
             )
         except (ValueError, TypeError):
             # Fall back to manual parsing
             start_dt = cls._manual_parse_date(text, reference_date)
             if start_dt.tzinfo is None:
-                start_dt = source_tz.localize(start_dt)
+                start_dt = start_dt.replace(tzinfo=source_tz)
 
         # Apply extracted times in source timezone
         if start_time:
@@ -154,29 +217,39 @@ class DateParser:
 
         return start_dt, end_dt
 
+    @classmethod
+    def _fast_parse_date(cls, text: str) -> Optional[datetime]:
+        """Parse common exact date formats from lowercased text; None if none match."""
+        # Drop timezone abbreviations (strptime month names are case-insensitive)
+        text = cls._TZ_RE.sub("", text).strip(" ,()")
+        for fmt in cls.FAST_DATE_FORMATS:
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+        return None
+
     @classmethod
     def _normalize_text(cls, text: str) -> str:
         """Normalize whitespace and common variations."""
-        text = " ".join(text.split())  # Normalize whitespace
-        text = text.replace("–", "-").replace("—", "-")  # Normalize dashes
-        text = text.replace("\u00a0", " ")  # Replace non-breaking spaces
-        return text
+        return _WS_RE.sub(" ", text.translate(_DASH_TRANS)).strip()
 
     @classmethod
-    def _detect_timezone(cls, text: str) -> pytz.timezone:
-        """Detect timezone from text, default to PST."""
-        text_upper = text.upper()
-        for tz_abbr, tz_name in cls.TIMEZONE_MAP.items():
-            # Match timezone abbreviation as a word boundary
-            if re.search(rf"\b{tz_abbr}\b", text_upper):
-                return pytz.timezone(tz_name)
-        return cls.PST
+    def _detect_timezone(cls, text: str, text_lower: Optional[str] = None) -> ZoneInfo:
+        """Detect timezone from text (or its precomputed lowercase), default to PST."""
+        if text_lower is None:
+            text_lower = text.lower()
+        matches = cls._TZ_RE.findall(text_lower)
+        if not matches:
+            return cls.PST
+        tz_abbr = min(matches, key=cls._TZ_PRIORITY.__getitem__)
+        return cls._TZ_OBJECTS[tz_abbr.upper()]
 
     @classmethod
-    def _localize_to_pst(cls, dt: datetime, source_tz: pytz.timezone) -> datetime:
+    def _localize_to_pst(cls, dt: datetime, source_tz: ZoneInfo) -> datetime:
         """Convert datetime to PST."""
         if dt.tzinfo is None:
-            dt = source_tz.localize(dt)
+            dt = dt.replace(tzinfo=source_tz)
         return dt.astimezone(cls.PST)
 
     @classmethod
@@ -188,67 +261,66 @@ class DateParser:
         Extract start and end times from text.
         Returns tuples of (hour, minute) in 24-hour format.
         """
-        text_lower = text.lower()
+        start_time, end_time, _ = cls._scan_time_tokens(text)
+        return start_time, end_time
 
-        # Patterns for time extraction
-        patterns = [
-            # 12:00-1:00pm or 12:00pm-1:00pm
-            r"(\d{1,2}):(\d{2})\s*([ap]m)?\s*[-\u2013]\s*(\d{1,2}):(\d{2})\s*([ap]m)",
-            # 12:00pm
-            r"(\d{1,2}):(\d{2})\s*([ap]m)",
-            # 12pm-1pm or 12-1pm
-            r"(\d{1,2})\s*([ap]m)?\s*[-\u2013]\s*(\d{1,2})\s*([ap]m)",
-        ]
-
-        # Pattern 1: Full time range with minutes (am/pm optional for 24-hour format)
-        match = re.search(
-            r"(\d{1,2}):(\d{2})\s*([ap]m)?\s*[-\u2013]\s*(\d{1,2}):(\d{2})\s*([ap]m)?",
-            text_lower,
-        )
-        if match:
-            start_hour, start_min = int(match.group(1)), int(match.group(2))
-            start_ampm = match.group(3) or match.group(6)
-            end_hour, end_min = int(match.group(4)), int(match.group(5))
-            end_ampm = match.group(6)
-
-            start_time = cls._convert_to_24h(start_hour, start_min, start_ampm)
-            end_time = cls._convert_to_24h(end_hour, end_min, end_ampm)
-            return start_time, end_time
-
-        # Pattern 2: Single time with minutes
-        match = re.search(r"(\d{1,2}):(\d{2})\s*([ap]m)", text_lower)
-        if match:
-            hour, minute = int(match.group(1)), int(match.group(2))
-            ampm = match.group(3)
-            start_time = cls._convert_to_24h(hour, minute, ampm)
-            return start_time, None
-
-        # Pattern 3: Hour range without minutes
-        match = re.search(r"(\d{1,2})\s*([ap]m)?\s*[-\u2013]\s*(\d{1,2})\s*([ap]m)", text_lower)
-        if match:
-            start_hour = int(match.group(1))
-            start_ampm = match.group(2) or match.group(4)
-            end_hour = int(match.group(3))
-            end_ampm = match.group(4)
+    @classmethod
+    def _scan_time_tokens(
+        cls,
+        text: str,
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]], str]:
+        """
+        Find the time range and strip time fragments in a single regex scan.
 
-            start_time = cls._convert_to_24h(start_hour, 0, start_ampm)
-            end_time = cls._convert_to_24h(end_hour, 0, end_ampm)
-            return start_time, end_time
+        A full range with minutes beats a single time, which beats an hour
+        range, wherever each appears. Ranges and single times with minutes
+        are removed from the returned text; hour ranges are left in place.
 
-        return None, None
+        Returns:
+            Tuple of (start_time, end_time, date_only_text)
+        """
+        # Every time token contains a colon or a dash
+        if ":" not in text and "-" not in text and "\u2013" not in text:
+            return None, None, text
+
+        first = {}
+        pieces = []
+        last_end = 0
+        for match in _TIME_TOKEN_RE.finditer(text):
+            kind = match.lastgroup
+            first.setdefault(kind, match)
+            if kind != "hours":
+                pieces.append(text[last_end:match.start()])
+                last_end = match.end()
+        pieces.append(text[last_end:])
+        date_only_text = "".join(pieces)
+
+        kind = next((k for k in _TIME_TOKEN_PRIORITY if k in first), None)
+        if kind is None:
+            return None, None, date_only_text
+
+        match = first[kind]
+        if kind == "range":
+            start_ampm = match["ra"] or match["rea"]
+            start_time = cls._convert_to_24h(int(match["rh"]), int(match["rm"]), start_ampm)
+            end_time = cls._convert_to_24h(int(match["reh"]), int(match["rem"]), match["rea"])
+            return start_time, end_time, date_only_text
+
+        if kind == "single":
+            start_time = cls._convert_to_24h(int(match["sh"]), int(match["sm"]), match["sa"])
+            return start_time, None, date_only_text
+
+        start_ampm = match["ha"] or match["hea"]
+        start_time = cls._convert_to_24h(int(match["hh"]), 0, start_ampm)
+        end_time = cls._convert_to_24h(int(match["heh"]), 0, match["hea"])
+        return start_time, end_time, date_only_text
 
     @classmethod
     def _convert_to_24h(
         cls, hour: int, minute: int, ampm: Optional[str]
     ) -> Tuple[int, int]:
         """Convert 12-hour time to 24-hour format."""
-        if ampm:
-            ampm = ampm.lower()
-            if ampm == "pm" and hour != 12:
-                hour += 12
-            elif ampm == "am" and hour == 12:
-                hour = 0
-        return (hour, minute)
+        return (_HOUR_CONVERT[hour, ampm.lower() if ampm else None], minute)
 
     @classmethod
     def _manual_parse_date(
@@ -257,49 +329,50 @@ class DateParser:
         reference_date: Optional[datetime],
     ) -> datetime:
         """Manually parse date when dateutil fails."""
+        # One scan rules out all five shapes; the ordered searches below only
+        # run when one exists (the first match of each decides, as before)
+        if not _FALLBACK_DATE_RE.search(text):
+            raise ValueError(f"Could not parse date from: {text}")
+
         if reference_date is None:
             reference_date = datetime.now(cls.PST)
 
         # Pattern: January 14, 2026 or Jan 14, 2026
-        match = re.search(
-            r"(\w+)\s+(\d{1,2}),?\s+(\d{4})", text, re.IGNORECASE
-        )
+        match = _DATE_MDY_WORD_RE.search(text)
         if match:
             month_str, day, year = match.groups()
             month = cls.MONTHS.get(month_str.lower()[:3])
             if month:
-                return cls.PST.localize(datetime(int(year), month, int(day)))
+                return datetime(int(year), month, int(day), tzinfo=cls.PST)
 
         # Pattern: 14 January 2026
-        match = re.search(
-            r"(\d{1,2})\s+(\w+)\s+(\d{4})", text, re.IGNORECASE
-        )
+        match = _DATE_DMY_WORD_RE.search(text)
         if match:
             day, month_str, year = match.groups()
             month = cls.MONTHS.get(month_str.lower()[:3])
             if month:
-                return cls.PST.localize(datetime(int(year), month, int(day)))
+                return datetime(int(year), month, int(day), tzinfo=cls.PST)
 
         # Pattern: 2026-01-14
-        match = re.search(r"(\d{4})-(\d{2})-(\d{2})", text)
+        match = _ISO_DATE_RE.search(text)
         if match:
             year, month, day = match.groups()
-            return cls.PST.localize(datetime(int(year), int(month), int(day)))
+            return datetime(int(year), int(month), int(day), tzinfo=cls.PST)
 
         # Pattern: 01/14/2026
-        match = re.search(r"(\d{1,2})/(\d{1,2})/(\d{4})", text)
+        match = _SLASH_DATE_RE.search(text)
         if match:
             month, day, year = match.groups()
-            return cls.PST.localize(datetime(int(year), int(month), int(day)))
+            return datetime(int(year), int(month), int(day), tzinfo=cls.PST)
 
         # Pattern: Jan 14 (no year - assume current or next year)
-        match = re.search(r"(\w{3,})\s+(\d{1,2})(?!\d)", text, re.IGNORECASE)
+        match = _MONTH_DAY_RE.search(text)
         if match:
             month_str, day = match.groups()
             month = cls.MONTHS.get(month_str.lower()[:3])
             if month:
                 year = reference_date.year
-                dt = cls.PST.localize(datetime(year, month, int(day)))
+                dt = datetime(year, month, int(day), tzinfo=cls.PST)
                 # If date has passed, assume next year
                 if dt < reference_date:
                     dt = dt.replace(year=year + 1)
@@ -310,20 +383,28 @@ class DateParser:
     @classmethod
     def get_date_range(cls, days: int = 14) -> Tuple[datetime, datetime]:
         """Get a date range from today for the specified number of days."""
-        now = datetime.now(cls.PST)
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = start + timedelta(days=days)
-        # Set end to end of day (11:59:59 PM) so events on the last day are included
-        end = end.replace(hour=23, minute=59, second=59)
+        return cls._cached_date_range(datetime.now(cls.PST).toordinal(), days)
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _cached_date_range(cls, day_ordinal: int, days: int) -> Tuple[datetime, datetime]:
+        """Date range starting at midnight PST of the given proleptic ordinal day."""
+        today = date.fromordinal(day_ordinal)
+        end_day = today + timedelta(days=days)
+        start = datetime(today.year, today.month, today.day, tzinfo=cls.PST)
+        # End at 11:59:59 PM so events on the last day are included
+        end = datetime(end_day.year, end_day.month, end_day.day, 23, 59, 59, tzinfo=cls.PST)
         return start, end
 
     @classmethod
+    @lru_cache(maxsize=64)
     def get_fixed_date_range(
         cls, start_str: str, end_str: str
     ) -> Tuple[datetime, datetime]:
         """Get a date range from explicit date strings (YYYY-MM-DD format)."""
-        start = cls.PST.localize(datetime.strptime(start_str, "%Y-%m-%d"))
-        end = cls.PST.localize(datetime.strptime(end_str, "%Y-%m-%d"))
+        start = datetime.strptime(start_str, "%Y-%m-%d").replace(tzinfo=cls.PST)
         # Set end to end of day
-        end = end.replace(hour=23, minute=59, second=59)
+        end = datetime.strptime(end_str, "%Y-%m-%d").replace(
+            hour=23, minute=59, second=59, tzinfo=cls.PST
+        )
         return start, end
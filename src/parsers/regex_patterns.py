@@ -0,0 +1,26 @@
+"""
+Regex building blocks shared by the scrapers' date patterns.
+"""
+
+import re
+
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+# Lowercase month names for cheap substring prechecks on lowercased text
+MONTH_NAMES_LOWER = tuple(name.lower() for name in MONTH_NAMES)
+
+# Full month names as one alternation, factored on shared prefixes (J-une/uly,
+# Ma-rch/y, A-pril/ugust) so fewer branches are tried at each position. It
+# matches exactly the strings "January|February|...|December" does.
+MONTHS = (
+    r"J(?:anuary|u(?:ne|ly))|February|Ma(?:rch|y)|A(?:pril|ugust)"
+    r"|September|October|November|December"
+)
+WEEKDAYS = "Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday"
+
+# "February 5, 2026" (any case)
+DATE_WITH_YEAR_RE = re.compile(
+    rf"((?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}})", re.IGNORECASE
+)
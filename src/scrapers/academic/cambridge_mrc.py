@@ -5,11 +5,47 @@ Note: DNS may be unreliable - site might be accessed via alternate URLs.
 """
 
 import re
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
+
+from playwright.async_api import Page
 
 from src.scrapers.base import BaseScraper
 from src.models.event import Event, LocationType
 from src.parsers.date_parser import DateParser
+from src.parsers.regex_patterns import MONTHS
+from src.core.exceptions import SiteUnreachableError
+
+# Listing-page text fallback: "14 January 2026 - Title"
+_EVENT_LINE_RE = re.compile(
+    rf"(\d{{1,2}}\s+(?:{MONTHS})\s+\d{{4}})"
+    r"\s*[-–:]\s*(.+?)(?:\n|$)",
+    re.IGNORECASE
+)
+# European "14 January 2026" or American "January 14, 2026", in one scan
+_DATE_RE = re.compile(
+    rf"(?P<euro>\d{{1,2}}\s+(?:{MONTHS})\s+\d{{4}})"
+    rf"|(?P<us>(?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}})",
+    re.IGNORECASE
+)
+# "14:00-15:00" or "2:00pm-3:00pm"
+_TIME_RANGE_RE = re.compile(
+    r"\d{1,2}:\d{2}\s*(?:am|pm)?\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm)?", re.IGNORECASE
+)
+# Date, time and speaker are separate scans: fused into one alternation,
+# a name can run across a line break into a following "January 14, 2026"
+# and a "2026" year can swallow the start of a "2026:00-..." time, hiding
+# the other match. Possessive quantifiers keep the name match from
+# backtracking.
+_SPEAKER_RE = re.compile(
+    r"(?:Speaker|Presenter|Talk by)[:\s]++"
+    r"([A-Z][a-z]++(?:\s++[A-Z]\.?)?\s++[A-Z][a-z]++(?:\s++[A-Z][a-z]++)?)"
+)
+_SPEAKER_KEYWORDS = ("Speaker", "Presenter", "Talk by")
+# Timezones already named in a date string; none of them occurs inside an
+# English month name, so a plain substring test is enough
+_TZ_NAMES = ("GMT", "BST", "UTC", "CET")
+# Navigation link titles, matched anywhere in the title (no word boundaries)
+_SKIP_TITLE_RE = re.compile(r"menu|back|home", re.IGNORECASE)
 
 
 class CambridgeMRCScraper(BaseScraper):
@@ -17,10 +53,15 @@ class CambridgeMRCScraper(BaseScraper):
 
     SOURCE_NAME = "Cambridge MRC BSU"
     BASE_URL = "https://www.mrc-bsu.cam.ac.uk/events/"
+    STATIC_HTML = True
+
+    # Tried in order when BASE_URL stays unreachable after navigate_to_page's
+    # own retries (the www host's DNS is unreliable)
+    ALTERNATE_URLS = ("https://mrc-bsu.cam.ac.uk/events/",)
 
     async def scrape(self) -> List[Event]:
         """Scrape Cambridge MRC BSU event listings."""
-        await self.navigate_to_page()
+        await self._navigate_to_listing()
 
         await self.wait_for_content("main, .content, body", timeout=15000)
 
@@ -28,58 +69,64 @@ class CambridgeMRCScraper(BaseScraper):
         event_data = await self._collect_event_urls()
         self.logger.info(f"Found {len(event_data)} Cambridge MRC events to process")
 
-        for data in event_data[:15]:
+        async def scrape_one(page: Page, data: Dict) -> Optional[Event]:
             try:
-                event = await self._scrape_event_page(data)
-                if event:
-                    self.events.append(event)
+                return await self._scrape_event_page(page, data)
             except Exception as e:
                 self.logger.warning(f"Failed to parse MRC event {data.get('url')}: {e}")
+                return None
+
+        # Detail pages are independent, so fetch them over parallel pages;
+        # listing entries unchanged since an earlier run reuse cached events
+        events = await self.scrape_detail_pages(event_data, scrape_one)
+        self.events.extend(event for event in events if event)
 
         return self.events
 
+    async def _navigate_to_listing(self) -> None:
+        """Open the listing page, falling back to ALTERNATE_URLS."""
+        urls = (self.BASE_URL, *self.ALTERNATE_URLS)
+        for i, url in enumerate(urls):
+            try:
+                await self.navigate_to_page(url)
+                return
+            except SiteUnreachableError:
+                if i == len(urls) - 1:
+                    raise
+                self.logger.warning(f"{url} unreachable, trying {urls[i + 1]}")
+
     async def _collect_event_urls(self) -> List[Dict]:
         """Collect event URLs from the listing page."""
         event_data = []
         seen_urls = set()
 
         # Try various event listing selectors (WordPress-based site)
-        items = await self.get_all_elements(
-            "article, .event-item, .views-row, .post, .hentry"
+        rows = await self.get_listing_rows(
+            "article, .event-item, .views-row, .post, .hentry",
+            link_selector="h2 a, h3 a, .entry-title a, a",
+            date_selector="time, .date, .event-date",
         )
 
-        for item in items:
-            try:
-                link = await item.query_selector("h2 a, h3 a, .entry-title a, a")
-                if not link:
-                    continue
+        for href, title, date_text, _ in rows:
+            if not href or not title or len(title) < 5:
+                continue
 
-                href = await self.get_href(link)
-                title = await self.get_element_text(link)
+            url_key = self.url_key(href)
+            if url_key in seen_urls:
+                continue
 
-                if not href or not title or len(title) < 5:
-                    continue
+            if _SKIP_TITLE_RE.search(title):
+                continue
 
-                if href in seen_urls:
-                    continue
-
-                if any(skip in title.lower() for skip in ["menu", "back", "home"]):
-                    continue
-
-                seen_urls.add(href)
-
-                # Try to get date
-                date_elem = await item.query_selector("time, .date, .event-date")
-                date_text = await self.get_element_text(date_elem) if date_elem else None
-
-                event_data.append({
-                    "title": title.strip(),
-                    "url": href,
-                    "date_text": date_text,
-                })
+            seen_urls.add(url_key)
 
-            except Exception as e:
-                self.logger.debug(f"Failed to collect event data: {e}")
+            event_data.append({
+                "title": title.strip(),
+                "url": href,
+                "date_text": date_text,
+            })
+            if len(event_data) >= self.MAX_EVENTS_PER_SOURCE:
+                break
 
         # Fallback: extract events from page text
         if not event_data:
@@ -93,13 +140,7 @@ class CambridgeMRCScraper(BaseScraper):
         events = []
 
         # Look for date + title patterns
-        pattern = re.compile(
-            r"(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})"
-            r"\s*[-–:]\s*(.+?)(?:\n|$)",
-            re.IGNORECASE
-        )
-
-        for match in pattern.finditer(body_text):
+        for match in _EVENT_LINE_RE.finditer(body_text):
             title = match.group(2).strip()
             if len(title) > 10:
                 events.append({
@@ -107,36 +148,40 @@ class CambridgeMRCScraper(BaseScraper):
                     "url": self.BASE_URL,
                     "date_text": match.group(1),
                 })
+                if len(events) >= self.MAX_EVENTS_PER_SOURCE:
+                    break
 
         return events
 
-    async def _scrape_event_page(self, data: Dict) -> Optional[Event]:
+    async def _scrape_event_page(self, page: Page, data: Dict) -> Optional[Event]:
         """Scrape individual event page for details."""
         url = data["url"]
         title = data["title"]
 
-        if url != self.BASE_URL:
-            await self.navigate_to_page(url)
+        if url == self.BASE_URL:
+            # Entries from the listing-text fallback: read the listing page itself
+            page = self.page
+        else:
+            await self.navigate_to_page(url, page=page)
 
-        body_text = await self.page.text_content("body") or ""
+        body_text, h1_text = await self.get_body_and_text("h1, .entry-title", page=page)
 
         # Get title from h1 if on detail page
-        if url != self.BASE_URL:
-            h1_text = await self.get_text("h1, .entry-title")
-            if h1_text and len(h1_text) > 10:
-                title = h1_text.strip()
+        if url != self.BASE_URL and h1_text and len(h1_text) > 10:
+            title = h1_text.strip()
+
+        # Extract date, time and speakers from the body
+        body_date, time_text, speakers = self._extract_details(body_text)
 
-        # Extract date
-        date_text = data.get("date_text") or self._extract_date(body_text)
+        date_text = data.get("date_text") or body_date
         if not date_text:
             return None
 
-        # Extract time
-        time_text = self._extract_time(body_text)
         full_date = f"{date_text} {time_text}".strip()
 
         # Cambridge is GMT/BST timezone
-        if not re.search(r"\b(?:GMT|BST|UTC|CET)\b", full_date, re.IGNORECASE):
+        full_date_upper = full_date.upper()
+        if not any(tz in full_date_upper for tz in _TZ_NAMES):
             full_date = f"{full_date} GMT"
 
         try:
@@ -145,9 +190,6 @@ class CambridgeMRCScraper(BaseScraper):
             self.logger.debug(f"Could not parse date '{full_date}': {e}")
             return None
 
-        # Extract speakers
-        speakers = self._extract_speakers(body_text)
-
         return self.create_event(
             title=title,
             url=url,
@@ -159,46 +201,29 @@ class CambridgeMRCScraper(BaseScraper):
             raw_date_text=full_date,
         )
 
-    def _extract_date(self, text: str) -> Optional[str]:
-        """Extract date from page text."""
-        # European format: "14 January 2026"
-        match = re.search(
-            r"(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})",
-            text, re.IGNORECASE
-        )
-        if match:
-            return match.group(1)
+    def _extract_details(self, text: str) -> Tuple[Optional[str], str, List[str]]:
+        """
+        Extract date, time range and speakers from page text.
 
-        # American format: "January 14, 2026"
-        match = re.search(
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})",
-            text, re.IGNORECASE
-        )
-        if match:
-            return match.group(1)
+        Prefers the European date format, falling back to the first American
+        date; the time range and speaker are the first ones in the text.
 
-        return None
+        Returns:
+            Tuple of (date text or None, time text or "", speaker names)
+        """
+        date_text = None
+        for match in _DATE_RE.finditer(text):
+            if match.lastgroup == "euro":
+                date_text = match.group("euro")
+                break
+            if date_text is None:
+                date_text = match.group("us")
 
-    def _extract_time(self, text: str) -> str:
-        """Extract time from page text."""
-        # Pattern: "14:00-15:00" or "2:00pm-3:00pm"
-        match = re.search(
-            r"(\d{1,2}:\d{2}\s*(?:am|pm)?\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm)?)",
-            text, re.IGNORECASE
-        )
-        if match:
-            return match.group(1)
-        return ""
+        match = ":" in text and _TIME_RANGE_RE.search(text)
+        time_text = match.group() if match else ""
 
-    def _extract_speakers(self, text: str) -> List[str]:
-        """Extract speaker names from text."""
-        speakers = []
-
-        match = re.search(
-            r"(?:Speaker|Presenter|Talk by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-            text
-        )
-        if match:
-            speakers.append(match.group(1).strip())
+        # Cheap substring check before running the regex over the whole body
+        match = any(k in text for k in _SPEAKER_KEYWORDS) and _SPEAKER_RE.search(text)
+        speakers = [match.group(1).strip()] if match else []
 
-        return speakers
+        return date_text, time_text, speakers
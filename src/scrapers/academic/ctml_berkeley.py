@@ -7,9 +7,41 @@ Drupal (OpenBerkeley) with event listings and seminar series pages.
 import re
 from typing import List, Optional, Dict
 
+from playwright.async_api import Page
+
 from src.scrapers.base import BaseScraper
 from src.models.event import Event, LocationType
 from src.parsers.date_parser import DateParser
+from src.parsers.regex_patterns import MONTH_NAMES_LOWER, MONTHS
+
+_SKIP_HREF_RE = re.compile(r"/people/|/about|/join|/donate|/contact|/news/", re.IGNORECASE)
+# Navigation and category link text, matched anywhere (no word boundaries)
+_SKIP_TEXT_RE = re.compile(
+    r"menu|back|home|read more|more events|view all|pause|next|previous|join us|"
+    r"big give|donate",
+    re.IGNORECASE
+)
+# Title date prefix: "2/11/26 Seminar: ..."
+_TITLE_DATE_PREFIX_RE = re.compile(r"^(\d{1,2}/\d{1,2}/\d{2,4})\s+")
+# Lowercase title prefixes stripped when followed by ":" or whitespace
+_TITLE_KIND_PREFIXES = ("seminar", "workshop", "talk", "lecture")
+# "February 11, 2026" or MM/DD/YYYY / MM/DD/YY, in one scan
+_DATE_RE = re.compile(
+    rf"(?P<us>(?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}})"
+    r"|(?P<num>\d{1,2}/\d{1,2}/\d{2,4})",
+    re.IGNORECASE
+)
+_TIME_RANGE_RE = re.compile(
+    r"(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))"
+)
+_TIME_RANGE_SHARED_AMPM_RE = re.compile(r"(\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))")
+_TZ_RE = re.compile(r"\b(?:PT|PST|PDT|ET|EST|EDT)\b", re.IGNORECASE)
+# Possessive quantifiers keep the name match from backtracking
+_SPEAKER_RE = re.compile(
+    r"(?:Speaker|Presenter|Presented by)[:\s]++([A-Z][a-z]++(?:\s++[A-Z]\.?)?\s++[A-Z][a-z]++(?:\s++[A-Z][a-z]++)?)"
+)
+_SPEAKER_KEYWORDS = ("Speaker", "Presenter", "Presented by")
+_BY_SPEAKER_RE = re.compile(r"\bby\s++([A-Z][a-z]++(?:\s++[A-Z]\.?)?\s++[A-Z][a-z]++)(?:,|\s+\()")
 
 
 class CTMLBerkeleyScraper(BaseScraper):
@@ -17,6 +49,7 @@ class CTMLBerkeleyScraper(BaseScraper):
 
     SOURCE_NAME = "CTML Berkeley"
     BASE_URL = "https://ctml.berkeley.edu/ctml-events"
+    STATIC_HTML = True
 
     async def scrape(self) -> List[Event]:
         """Scrape CTML Berkeley event listings."""
@@ -29,13 +62,17 @@ class CTMLBerkeleyScraper(BaseScraper):
         self.logger.info(f"Found {len(event_data)} CTML Berkeley events to process")
 
         # Visit each event page for details
-        for data in event_data[:15]:
+        async def scrape_one(page: Page, data: Dict) -> Optional[Event]:
             try:
-                event = await self._scrape_event_page(data)
-                if event:
-                    self.events.append(event)
+                return await self._scrape_event_page(page, data)
             except Exception as e:
                 self.logger.warning(f"Failed to parse CTML event {data.get('url')}: {e}")
+                return None
+
+        # Detail pages are independent, so fetch them over parallel pages;
+        # listing entries unchanged since an earlier run reuse cached events
+        events = await self.scrape_detail_pages(event_data, scrape_one)
+        self.events.extend(event for event in events if event)
 
         return self.events
 
@@ -45,77 +82,68 @@ class CTMLBerkeleyScraper(BaseScraper):
         seen_urls = set()
 
         # Drupal uses h3 links with event titles, also try broader link selectors
-        links = await self.get_all_elements(
+        rows = await self.get_listing_rows(
             "h3 a, h2 a, .views-row a, .panopoly-spotlight a, "
             "a[href*='/seminar'], a[href*='/workshop'], a[href*='/event']"
         )
 
-        for link in links:
-            try:
-                href = await self.get_href(link)
-                text = await self.get_element_text(link) or ""
-
-                if not href or not text or len(text) < 10:
-                    continue
-
-                if href in seen_urls:
-                    continue
-
-                # Only follow internal detail pages
-                if "ctml.berkeley.edu" not in href and not href.startswith("/"):
-                    continue
-
-                # Skip non-event pages (people, about, join, etc.)
-                if re.search(r"/people/|/about|/join|/donate|/contact|/news/", href, re.IGNORECASE):
-                    continue
-
-                # Skip navigation and category links
-                if any(skip in text.lower() for skip in [
-                    "menu", "back", "home", "read more", "more events",
-                    "view all", "pause", "next", "previous", "join us",
-                    "big give", "donate"
-                ]):
-                    continue
-
-                seen_urls.add(href)
-
-                # Event titles often include date prefix: "2/11/26 Seminar: ..."
-                title = text.strip()
-                date_text = None
-                date_match = re.match(r"(\d{1,2}/\d{1,2}/\d{2,4})\s+", title)
-                if date_match:
-                    date_text = date_match.group(1)
-                    title = title[date_match.end():].strip()
-
-                event_data.append({
-                    "title": title,
-                    "url": href,
-                    "date_text": date_text,
-                })
+        for href, text, _, _ in rows:
+            if not href or not text or len(text) < 10:
+                continue
 
-            except Exception as e:
-                self.logger.debug(f"Failed to collect event URL: {e}")
+            url_key = self.url_key(href)
+            if url_key in seen_urls:
+                continue
+
+            # Only follow internal detail pages
+            if "ctml.berkeley.edu" not in href and not href.startswith("/"):
+                continue
+
+            # Skip non-event pages (people, about, join, etc.)
+            if _SKIP_HREF_RE.search(href):
+                continue
+
+            # Skip navigation and category links
+            if _SKIP_TEXT_RE.search(text):
+                continue
+
+            seen_urls.add(url_key)
+
+            # Event titles often include date prefix: "2/11/26 Seminar: ..."
+            title = text.strip()
+            date_text = None
+            date_match = _TITLE_DATE_PREFIX_RE.match(title)
+            if date_match:
+                date_text = date_match.group(1)
+                title = title[date_match.end():].strip()
+
+            event_data.append({
+                "title": title,
+                "url": href,
+                "date_text": date_text,
+            })
+            if len(event_data) >= self.MAX_EVENTS_PER_SOURCE:
+                break
 
         return event_data
 
-    async def _scrape_event_page(self, data: Dict) -> Optional[Event]:
+    async def _scrape_event_page(self, page: Page, data: Dict) -> Optional[Event]:
         """Scrape individual event page for details."""
         url = data["url"]
         title = data["title"]
 
-        await self.navigate_to_page(url)
+        await self.navigate_to_page(url, page=page)
 
-        body_text = await self.page.text_content("body") or ""
+        body_text, h1_text = await self.get_body_and_text("h1", page=page)
 
         # Get better title from h1
-        h1_text = await self.get_text("h1")
         if h1_text and len(h1_text) > 10:
             title = h1_text.strip()
             # Remove date prefix if present
-            title = re.sub(r"^\d{1,2}/\d{1,2}/\d{2,4}\s+", "", title)
+            title = _TITLE_DATE_PREFIX_RE.sub("", title)
 
         # Remove "Seminar:" or "Workshop:" prefix for cleaner title
-        title = re.sub(r'^(?:Seminar|Workshop|Talk|Lecture)[:\s]+', '', title, flags=re.IGNORECASE)
+        title = self._strip_kind_prefix(title)
         title = title.strip('" ')
 
         # Extract date
@@ -128,7 +156,7 @@ class CTMLBerkeleyScraper(BaseScraper):
         full_date = f"{date_text} {time_text}".strip()
 
         # Add PT timezone
-        if not re.search(r"\b(?:PT|PST|PDT|ET|EST|EDT)\b", full_date, re.IGNORECASE):
+        if not _TZ_RE.search(full_date):
             full_date = f"{full_date} PT"
 
         try:
@@ -151,39 +179,46 @@ class CTMLBerkeleyScraper(BaseScraper):
             raw_date_text=full_date,
         )
 
-    def _extract_date(self, text: str) -> Optional[str]:
-        """Extract date from page text."""
-        # Pattern: "February 11, 2026" or "Feb 11, 2026"
-        match = re.search(
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{1,2},?\s+\d{4})",
-            text, re.IGNORECASE
-        )
-        if match:
-            return match.group(1)
-
-        # Pattern: MM/DD/YYYY or MM/DD/YY
-        match = re.search(r"(\d{1,2}/\d{1,2}/\d{2,4})", text)
-        if match:
-            return match.group(1)
+    def _strip_kind_prefix(self, title: str) -> str:
+        """Remove a leading "Seminar:"/"Workshop "/... label from a title."""
+        for kind in _TITLE_KIND_PREFIXES:
+            if title[:len(kind)].lower() == kind:
+                end = len(kind)
+                while end < len(title) and (title[end] == ":" or title[end].isspace()):
+                    end += 1
+                if end > len(kind):
+                    return title[end:]
+                break
+        return title
 
-        return None
+    def _extract_date(self, text: str) -> Optional[str]:
+        """Extract date from page text, preferring a written-out month."""
+        # Needs a month name or a slash-separated date
+        if "/" not in text:
+            text_lower = text.lower()
+            if not any(month in text_lower for month in MONTH_NAMES_LOWER):
+                return None
+
+        numeric_date = None
+        for match in _DATE_RE.finditer(text):
+            if match.lastgroup == "us":
+                return match.group("us")
+            if numeric_date is None:
+                numeric_date = match.group("num")
+        return numeric_date
 
     def _extract_time(self, text: str) -> str:
         """Extract time from page text."""
+        if ":" not in text:
+            return ""
+
         # Pattern: "3:30 PM - 5:00 PM" or "3:30pm-5:00pm"
-        match = re.search(
-            r"(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))",
-            text
-        )
+        match = _TIME_RANGE_RE.search(text)
         if match:
             return match.group(1)
 
         # Pattern: "3:30-5:00 PM"
-        match = re.search(
-            r"(\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))",
-            text
-        )
+        match = _TIME_RANGE_SHARED_AMPM_RE.search(text)
         if match:
             return match.group(1)
 
@@ -193,20 +228,15 @@ class CTMLBerkeleyScraper(BaseScraper):
         """Extract speaker names from text."""
         speakers = []
 
-        # Pattern: "Speaker: Name" or "Presenter: Name"
-        match = re.search(
-            r"(?:Speaker|Presenter|Presented by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-            text
-        )
+        # Pattern: "Speaker: Name" or "Presenter: Name" (keyword check skips
+        # the regex scan on bodies that cannot match)
+        match = any(k in text for k in _SPEAKER_KEYWORDS) and _SPEAKER_RE.search(text)
         if match:
             speakers.append(match.group(1).strip())
             return speakers
 
         # Pattern: "by Name, Institution"
-        match = re.search(
-            r"\bby\s+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)(?:,|\s+\()",
-            text
-        )
+        match = _BY_SPEAKER_RE.search(text)
         if match:
             speakers.append(match.group(1).strip())
 
@@ -8,9 +8,37 @@ import re
 import asyncio
 from typing import List, Optional, Dict
 
+from playwright.async_api import Page
+
 from src.scrapers.base import BaseScraper
 from src.models.event import Event, LocationType
 from src.parsers.date_parser import DateParser
+from src.parsers.regex_patterns import MONTH_NAMES_LOWER, MONTHS
+
+_TZ_RE = re.compile(r"\b(?:ET|EST|EDT|PST|PDT|CT|GMT)\b", re.IGNORECASE)
+# Navigation link titles, matched anywhere in the title (no word boundaries)
+_SKIP_TITLE_RE = re.compile(r"next|previous|view|menu", re.IGNORECASE)
+# The Events Calendar: "February 12 @ 4:00 pm - 5:00 pm EST"
+_TRIBE_DATE_TIME_RE = re.compile(
+    rf"((?:{MONTHS})"
+    r"\s+\d{1,2}(?:,?\s+\d{4})?)"
+    r"\s*@?\s*"
+    r"(\d{1,2}:\d{2}\s*(?:am|pm)\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm))"
+    r"(?:\s*(EST|EDT|ET|PST|PDT|CT|CST|CDT))?",
+    re.IGNORECASE
+)
+_YEAR_RE = re.compile(r"\d{4}")
+_DATE_US_RE = re.compile(rf"((?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}})", re.IGNORECASE)
+# Possessive quantifiers keep the name match from backtracking
+_SPEAKER_RE = re.compile(
+    r"(?:Speaker|Presenter|Featuring)[:\s]++([A-Z][a-z]++(?:\s++[A-Z]\.?)?\s++[A-Z][a-z]++(?:\s++[A-Z][a-z]++)?)"
+)
+_SPEAKER_KEYWORDS = ("Speaker", "Presenter", "Featuring")
+_SPEAKER_AFFILIATION_RE = re.compile(
+    r"(?:^|\n)\s*+([A-Z][a-z]++(?:\s++[A-Z]\.?)?\s++[A-Z][a-z]++),\s+"
+    r"(?:Harvard|MIT|Stanford|Duke|DFCI|Dana.?Farber|Boston)"
+)
+_LOCATION_RE = re.compile(r"(?:Venue|Location|Room|Building)[:\s]+([A-Z][^\n]{5,50})")
 
 
 class DanaFarberScraper(BaseScraper):
@@ -18,6 +46,7 @@ class DanaFarberScraper(BaseScraper):
 
     SOURCE_NAME = "Dana Farber Data Science"
     BASE_URL = "https://ds.dfci.harvard.edu/events/"
+    STATIC_HTML = True
 
     async def scrape(self) -> List[Event]:
         """Scrape Dana Farber Data Science events."""
@@ -33,13 +62,17 @@ class DanaFarberScraper(BaseScraper):
         event_data = await self._collect_event_urls()
         self.logger.info(f"Found {len(event_data)} Dana Farber events to process")
 
-        for data in event_data[:15]:
+        async def scrape_one(page: Page, data: Dict) -> Optional[Event]:
             try:
-                event = await self._scrape_event_page(data)
-                if event:
-                    self.events.append(event)
+                return await self._scrape_event_page(page, data)
             except Exception as e:
                 self.logger.warning(f"Failed to parse Dana Farber event {data.get('url')}: {e}")
+                return None
+
+        # Detail pages are independent, so fetch them over parallel pages;
+        # listing entries unchanged since an earlier run reuse cached events
+        events = await self.scrape_detail_pages(event_data, scrape_one)
+        self.events.extend(event for event in events if event)
 
         return self.events
 
@@ -49,75 +82,64 @@ class DanaFarberScraper(BaseScraper):
         seen_urls = set()
 
         # tribe-events uses article or list-item containers
-        items = await self.get_all_elements(
+        rows = await self.get_listing_rows(
             ".tribe-events-calendar-list__event-row, "
             "article.tribe-events-calendar-list__event, "
             ".tribe-events-calendar-list__event-details, "
-            "article"
+            "article",
+            link_selector=(
+                "a[href*='/event/'], h3 a, h2 a, .tribe-events-calendar-list__event-title a"
+            ),
+            date_selector="time, .tribe-events-calendar-list__event-datetime",
         )
 
-        for item in items:
-            try:
-                # Get event link
-                link = await item.query_selector(
-                    "a[href*='/event/'], h3 a, h2 a, .tribe-events-calendar-list__event-title a"
-                )
-                if not link:
-                    continue
-
-                href = await self.get_href(link)
-                title = await self.get_element_text(link)
+        for href, title, date_text, _ in rows:
+            if not href or not title or len(title) < 5:
+                continue
+            url_key = self.url_key(href)
+            if url_key in seen_urls:
+                continue
 
-                if not href or not title or len(title) < 5:
-                    continue
-                if href in seen_urls:
-                    continue
+            # Skip navigation links
+            if _SKIP_TITLE_RE.search(title):
+                continue
 
-                # Skip navigation links
-                if any(skip in title.lower() for skip in ["next", "previous", "view", "menu"]):
-                    continue
+            seen_urls.add(url_key)
 
-                seen_urls.add(href)
-
-                # Try to get date from listing
-                time_elem = await item.query_selector("time, .tribe-events-calendar-list__event-datetime")
-                date_text = await self.get_element_text(time_elem) if time_elem else None
-
-                event_data.append({
-                    "title": title.strip(),
-                    "url": href,
-                    "date_text": date_text,
-                })
-
-            except Exception as e:
-                self.logger.debug(f"Failed to collect event data: {e}")
+            event_data.append({
+                "title": title.strip(),
+                "url": href,
+                "date_text": date_text,
+            })
+            if len(event_data) >= self.MAX_EVENTS_PER_SOURCE:
+                break
 
         # Fallback: extract links from whole page
         if not event_data:
-            links = await self.get_all_elements("a[href*='/event/']")
-            for link in links:
-                try:
-                    href = await self.get_href(link)
-                    text = await self.get_element_text(link) or ""
-                    if href and text and len(text) > 10 and href not in seen_urls:
-                        seen_urls.add(href)
-                        event_data.append({"title": text.strip(), "url": href})
-                except Exception:
-                    pass
+            for href, text, _, _ in await self.get_listing_rows("a[href*='/event/']"):
+                if href and text and len(text) > 10:
+                    url_key = self.url_key(href)
+                    if url_key in seen_urls:
+                        continue
+                    seen_urls.add(url_key)
+                    event_data.append({"title": text.strip(), "url": href})
+                    if len(event_data) >= self.MAX_EVENTS_PER_SOURCE:
+                        break
 
         return event_data
 
-    async def _scrape_event_page(self, data: Dict) -> Optional[Event]:
+    async def _scrape_event_page(self, page: Page, data: Dict) -> Optional[Event]:
         """Scrape individual event page for details."""
         url = data["url"]
         title = data["title"]
 
-        await self.navigate_to_page(url)
+        await self.navigate_to_page(url, page=page)
 
-        body_text = await self.page.text_content("body") or ""
+        body_text, h1_text = await self.get_body_and_text(
+            "h1, .tribe-events-single-event-title", page=page
+        )
 
         # Get better title from h1
-        h1_text = await self.get_text("h1, .tribe-events-single-event-title")
         if h1_text and len(h1_text) > 10:
             title = h1_text.strip()
 
@@ -133,7 +155,7 @@ class DanaFarberScraper(BaseScraper):
         date_text = date_text.replace("@", "").replace("  ", " ")
 
         # Add ET timezone if none present
-        if not re.search(r"\b(?:ET|EST|EDT|PST|PDT|CT|GMT)\b", date_text, re.IGNORECASE):
+        if not _TZ_RE.search(date_text):
             date_text = f"{date_text} ET"
 
         try:
@@ -148,10 +170,11 @@ class DanaFarberScraper(BaseScraper):
         # Detect location type
         location_type = self.detect_location_type(body_text)
         if location_type == LocationType.UNKNOWN:
-            # Check for "Zoominar" in the event type
-            if "zoom" in body_text.lower() or "zoominar" in body_text.lower():
+            body_lower = body_text.lower()
+            # Check for "Zoom"/"Zoominar" in the event type
+            if "zoom" in body_lower:
                 location_type = LocationType.VIRTUAL
-            elif "seminar" in body_text.lower():
+            elif "seminar" in body_lower:
                 location_type = LocationType.IN_PERSON
 
         # Extract location details
@@ -171,31 +194,25 @@ class DanaFarberScraper(BaseScraper):
 
     def _extract_date_time(self, text: str) -> Optional[str]:
         """Extract date/time from The Events Calendar format."""
+        # Both patterns need a month name; skip the scans when none is present
+        text_lower = text.lower()
+        if not any(month in text_lower for month in MONTH_NAMES_LOWER):
+            return None
+
         # Pattern: "February 12 @ 4:00 pm - 5:00 pm EST"
-        match = re.search(
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{1,2}(?:,?\s+\d{4})?)"
-            r"\s*@?\s*"
-            r"(\d{1,2}:\d{2}\s*(?:am|pm)\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm))"
-            r"(?:\s*(EST|EDT|ET|PST|PDT|CT|CST|CDT))?",
-            text, re.IGNORECASE
-        )
+        match = ":" in text and _TRIBE_DATE_TIME_RE.search(text)
         if match:
             date_str = match.group(1)
             time_str = match.group(2)
             tz = match.group(3) or "ET"
             # Ensure year is present
-            if not re.search(r"\d{4}", date_str):
+            if not _YEAR_RE.search(date_str):
                 from datetime import datetime
                 date_str = f"{date_str}, {datetime.now().year}"
             return f"{date_str} {time_str} {tz}"
 
         # Simpler pattern: just date
-        match = re.search(
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{1,2},?\s+\d{4})",
-            text, re.IGNORECASE
-        )
+        match = _DATE_US_RE.search(text)
         if match:
             return match.group(1)
 
@@ -205,21 +222,15 @@ class DanaFarberScraper(BaseScraper):
         """Extract speaker names from event text."""
         speakers = []
 
-        # Pattern: "Speaker: Name" or "Presenter: Name"
-        match = re.search(
-            r"(?:Speaker|Presenter|Featuring)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-            text
-        )
+        # Pattern: "Speaker: Name" or "Presenter: Name" (keyword check skips
+        # the regex scan on bodies that cannot match)
+        match = any(k in text for k in _SPEAKER_KEYWORDS) and _SPEAKER_RE.search(text)
         if match:
             speakers.append(match.group(1).strip())
             return speakers
 
         # Pattern: "Name, Institution" near top of page
-        match = re.search(
-            r"(?:^|\n)\s*([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+),\s+"
-            r"(?:Harvard|MIT|Stanford|Duke|DFCI|Dana.?Farber|Boston)",
-            text
-        )
+        match = _SPEAKER_AFFILIATION_RE.search(text)
         if match:
             speakers.append(match.group(1).strip())
 
@@ -228,10 +239,7 @@ class DanaFarberScraper(BaseScraper):
     def _extract_location(self, text: str) -> Optional[str]:
         """Extract location details from text."""
         # Pattern: "Venue: Location" or building name
-        match = re.search(
-            r"(?:Venue|Location|Room|Building)[:\s]+([A-Z][^\n]{5,50})",
-            text
-        )
+        match = _LOCATION_RE.search(text)
         if match:
             return match.group(1).strip()
         return None
@@ -5,11 +5,29 @@ Drupal with Views module and AJAX-enabled filtering.
 """
 
 import re
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
+
+from playwright.async_api import Page
 
 from src.scrapers.base import BaseScraper
 from src.models.event import Event, LocationType
 from src.parsers.date_parser import DateParser
+from src.parsers.regex_patterns import MONTHS
+
+_TZ_RE = re.compile(r"\b(?:ET|EST|EDT|PST|PDT|CT)\b", re.IGNORECASE)
+# Non-event link titles, matched anywhere in the title (no word boundaries)
+_SKIP_TITLE_RE = re.compile(r"read more|view all|menu|back", re.IGNORECASE)
+# "February 19, 2026" date (any case) or "1:00 PM - 2:30 PM ET" time range, in
+# one scan
+_DATE_TIME_RE = re.compile(
+    rf"(?i:(?P<date>(?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}}))"
+    r"|(?P<time>\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))"
+    r"(?:\s*(?P<tz>ET|EST|EDT|PT|PST|PDT|CT))?"
+)
+_SPEAKER_RE = re.compile(
+    r"(?:Speaker|Presenter|Panelist|Featuring)[s]?[:\s]+(.+?)(?:\n|$)", re.IGNORECASE
+)
+_SPEAKER_KEYWORDS = ("speaker", "presenter", "panelist", "featuring")
 
 
 class DukeMargolisScraper(BaseScraper):
@@ -28,14 +46,17 @@ class DukeMargolisScraper(BaseScraper):
         event_data = await self._collect_event_urls()
         self.logger.info(f"Found {len(event_data)} Duke-Margolis events to process")
 
-        # Visit each event page for details
-        for data in event_data[:15]:
+        async def scrape_one(page: Page, data: Dict) -> Optional[Event]:
             try:
-                event = await self._scrape_event_page(data)
-                if event:
-                    self.events.append(event)
+                return await self._scrape_event_page(page, data)
             except Exception as e:
                 self.logger.warning(f"Failed to parse Duke-Margolis event {data.get('url')}: {e}")
+                return None
+
+        # Detail pages are independent, so fetch them over parallel pages;
+        # listing entries unchanged since an earlier run reuse cached events
+        events = await self.scrape_detail_pages(event_data, scrape_one)
+        self.events.extend(event for event in events if event)
 
         return self.events
 
@@ -45,100 +66,79 @@ class DukeMargolisScraper(BaseScraper):
         seen_urls = set()
 
         # Drupal views typically use article elements or views-row divs
-        items = await self.get_all_elements(
-            ".views-row, article, .node--type-event"
+        rows = await self.get_listing_rows(
+            ".views-row, article, .node--type-event",
+            link_selector="h2 a, h3 a, .field--name-title a, a[href*='/events/']",
+            date_selector=".datetime, .date, time, .field--name-field-event-date",
+            category_selector=".field--name-field-event-type, .category, .tag",
         )
 
-        for item in items:
-            try:
-                # Get title link
-                link = await item.query_selector(
-                    "h2 a, h3 a, .field--name-title a, a[href*='/events/']"
-                )
-                if not link:
-                    continue
-
-                href = await self.get_href(link)
-                title = await self.get_element_text(link)
-
-                if not href or not title or len(title) < 5:
-                    continue
-
-                if href in seen_urls:
-                    continue
-
-                # Skip non-event links
-                if any(skip in title.lower() for skip in [
-                    "read more", "view all", "menu", "back"
-                ]):
-                    continue
-
-                seen_urls.add(href)
-
-                # Try to get date from listing
-                date_elem = await item.query_selector(
-                    ".datetime, .date, time, .field--name-field-event-date"
-                )
-                date_text = await self.get_element_text(date_elem) if date_elem else None
-
-                # Try to get category
-                cat_elem = await item.query_selector(
-                    ".field--name-field-event-type, .category, .tag"
-                )
-                category = await self.get_element_text(cat_elem) if cat_elem else None
-
-                event_data.append({
-                    "title": title.strip(),
-                    "url": href,
-                    "date_text": date_text,
-                    "category": category,
-                })
+        for href, title, date_text, category in rows:
+            if not href or not title or len(title) < 5:
+                continue
 
-            except Exception as e:
-                self.logger.debug(f"Failed to collect event data: {e}")
+            url_key = self.url_key(href)
+            if url_key in seen_urls:
+                continue
+
+            # Skip non-event links
+            if _SKIP_TITLE_RE.search(title):
+                continue
+
+            seen_urls.add(url_key)
+
+            event_data.append({
+                "title": title.strip(),
+                "url": href,
+                "date_text": date_text,
+                "category": category,
+            })
+            if len(event_data) >= self.MAX_EVENTS_PER_SOURCE:
+                break
 
         # Fallback: extract any event-like links
         if not event_data:
-            links = await self.get_all_elements("a")
-            for link in links:
-                try:
-                    href = await self.get_href(link)
-                    text = await self.get_element_text(link) or ""
-                    if (href and "healthpolicy.duke.edu" in href and
-                            "/events/" in href and len(text) > 10 and
-                            href not in seen_urls):
-                        seen_urls.add(href)
-                        event_data.append({"title": text.strip(), "url": href})
-                except Exception:
-                    pass
+            for href, text, _, _ in await self.get_listing_rows("a"):
+                if (href and text and "healthpolicy.duke.edu" in href and
+                        "/events/" in href and len(text) > 10):
+                    url_key = self.url_key(href)
+                    if url_key in seen_urls:
+                        continue
+                    seen_urls.add(url_key)
+                    event_data.append({"title": text.strip(), "url": href})
+                    if len(event_data) >= self.MAX_EVENTS_PER_SOURCE:
+                        break
 
         return event_data
 
-    async def _scrape_event_page(self, data: Dict) -> Optional[Event]:
+    async def _scrape_event_page(self, page: Page, data: Dict) -> Optional[Event]:
         """Scrape individual event page for details."""
         url = data["url"]
         title = data["title"]
 
-        await self.navigate_to_page(url)
+        await self.navigate_to_page(url, page=page)
 
-        body_text = await self.page.text_content("body") or ""
+        body_text, h1_text = await self.get_body_and_text("h1", page=page)
 
         # Get better title from h1
-        h1_text = await self.get_text("h1")
         if h1_text and len(h1_text) > 10:
             title = h1_text.strip()
 
-        # Extract date
-        date_text = data.get("date_text") or self._extract_date(body_text)
+        # Extract date and time in a single pass over the body; a date from
+        # the listing means the scan can stop at the first time range
+        listing_date = data.get("date_text")
+        body_date, time_text = self._extract_date_time(
+            body_text, need_date=not listing_date
+        )
+
+        date_text = listing_date or body_date
         if not date_text:
             return None
 
-        # Extract time
-        time_text = self._extract_time(body_text)
         full_date = f"{date_text} {time_text}".strip()
 
         # Add ET timezone if none present
-        if not re.search(r"\b(?:ET|EST|EDT|PST|PDT|CT)\b", full_date, re.IGNORECASE):
+        if not _TZ_RE.search(full_date):
             full_date = f"{full_date} ET"
 
         try:
@@ -148,12 +148,11 @@ class DukeMargolisScraper(BaseScraper):
             return None
 
         # Detect location type
+        # detect_location_type already looks for "webinar"/"virtual", so a
+        # page it cannot classify is an in-person event
         location_type = self.detect_location_type(body_text)
         if location_type == LocationType.UNKNOWN:
-            if "webinar" in body_text.lower() or "virtual" in body_text.lower():
-                location_type = LocationType.VIRTUAL
-            else:
-                location_type = LocationType.IN_PERSON
+            location_type = LocationType.IN_PERSON
 
         # Extract speakers
         speakers = self._extract_speakers(body_text)
@@ -169,45 +168,45 @@ class DukeMargolisScraper(BaseScraper):
             raw_date_text=full_date,
         )
 
-    def _extract_date(self, text: str) -> Optional[str]:
-        """Extract date from page text."""
-        # Pattern: "February 19, 2026"
-        match = re.search(
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{1,2},?\s+\d{4})",
-            text, re.IGNORECASE
-        )
-        if match:
-            return match.group(1)
-
-        return None
-
-    def _extract_time(self, text: str) -> str:
-        """Extract time from page text."""
-        # Pattern: "1:00 PM - 2:30 PM ET"
-        match = re.search(
-            r"(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))"
-            r"(?:\s*(ET|EST|EDT|PT|PST|PDT|CT))?",
-            text
-        )
-        if match:
-            result = match.group(1)
-            tz = match.group(2)
-            if tz:
-                result = f"{result} {tz}"
-            return result
-
-        return ""
+    def _extract_date_time(
+        self, text: str, need_date: bool = True
+    ) -> Tuple[Optional[str], str]:
+        """
+        Extract the first date and the first time range from page text.
+
+        Args:
+            text: Page body text
+            need_date: If False, stop at the first time range without a date
+
+        Returns:
+            Tuple of (date text or None, time text with timezone or "")
+        """
+        date_text = time_text = None
+        for match in _DATE_TIME_RE.finditer(text):
+            if match.lastgroup == "date":
+                if date_text is None:
+                    date_text = match.group("date")
+            elif time_text is None:
+                # Pattern: "1:00 PM - 2:30 PM ET"
+                time_text = match.group("time")
+                if match.group("tz"):
+                    time_text = f"{time_text} {match.group('tz')}"
+
+            if time_text and (date_text or not need_date):
+                break
+
+        return date_text, time_text or ""
 
     def _extract_speakers(self, text: str) -> List[str]:
         """Extract speaker names from text."""
         speakers = []
 
-        # Pattern: "Speaker(s):" or "Presenter(s):" or "Panelist(s):"
-        match = re.search(
-            r"(?:Speaker|Presenter|Panelist|Featuring)[s]?[:\s]+(.+?)(?:\n|$)",
-            text, re.IGNORECASE
-        )
+        # Pattern: "Speaker(s):" or "Presenter(s):" or "Panelist(s):" (the
+        # pattern is case-insensitive, so the keyword check runs on lowercase)
+        text_lower = text.lower()
+        if not any(k in text_lower for k in _SPEAKER_KEYWORDS):
+            return speakers
+        match = _SPEAKER_RE.search(text)
         if match:
             speaker_text = match.group(1).strip()
             if len(speaker_text) < 200:
@@ -4,16 +4,50 @@ Site: https://statistics.gmu.edu/about/events
 Uses 25Live/Trumba JSON API (bypasses JS widget rendering).
 """
 
+import html
 import re
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional
-import pytz
 
 from src.scrapers.base import BaseScraper
-from src.models.event import Event, LocationType
+from src.models.event import Event, LocationType, PST
 from src.parsers.date_parser import DateParser
 
+# Block-level tags that become newlines
+_BLOCK_TAG_RE = re.compile(r"<(?:br\s*/?|/p|/div|/li)>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACES_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+_WS_RE = re.compile(r"\s+")
+# Description lines that end the talk title: speaker, location, meta, schedule
+_TALK_STOP_RE = re.compile(
+    r"^(?:Dr\.|Prof\.|Professor |Speaker|Location|"
+    r"This seminar|Abstract|Bio|Register|REGISTER|"
+    r"Please |Join us|Zoom|https?://|"
+    r"Schedule|Come see|Come join|RSVP|\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))",
+    re.IGNORECASE
+)
+# "Name Surname, Position, Department" line
+_NAME_POSITION_RE = re.compile(r"^[A-Z][a-z]+\s+[A-Z][a-z]+,\s+")
+_TITLED_SPEAKER_RE = re.compile(
+    r"(?:Dr\.|Prof\.|Professor )\s*([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:-[A-Z][a-z]+)?)"
+)
+_SPEAKER_RE = re.compile(
+    r"(?:Speaker|Presenter|Presented by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:-[A-Z][a-z]+)?)"
+)
+# Literals one of the two speaker patterns needs; without any the regexes are skipped
+_SPEAKER_KEYWORDS = ("Dr.", "Prof", "Speaker", "Presenter", "Presented by")
+
+
+@lru_cache(maxsize=None)
+def _offset_tz(offset: str) -> timezone:
+    """Fixed-offset timezone for a "-0500"-style offset (the feed uses only a few)."""
+    hours = int(offset[:3])
+    minutes = int(offset[0] + offset[3:5])
+    return timezone(timedelta(hours=hours, minutes=minutes))
+
 
 class GMUScraper(BaseScraper):
     """Scraper for GMU R. Clifton Bailey Statistics Seminar Series."""
@@ -21,36 +55,22 @@ class GMUScraper(BaseScraper):
     SOURCE_NAME = "George Mason University R. Clifton Bailey Statistics Seminar Series"
     BASE_URL = "https://statistics.gmu.edu/about/events"
     API_URL = "https://25livepub.collegenet.com/calendars/cec-statistics.json"
-    ET = pytz.timezone("America/New_York")
-    PST = pytz.timezone("America/Los_Angeles")
 
     async def scrape(self) -> List[Event]:
         """Scrape GMU seminar listings from 25Live JSON API."""
-        response = await self.page.goto(
-            self.API_URL, wait_until="domcontentloaded", timeout=30000
-        )
+        # Fetch the feed through the context's request API: no page
+        # navigation, so the browser never renders the JSON as a document
+        response = await self.page.context.request.get(self.API_URL, timeout=30000)
 
-        if not response or response.status != 200:
-            self.logger.error(
-                f"Failed to fetch GMU JSON: status "
-                f"{response.status if response else 'no response'}"
-            )
+        if response.status != 200:
+            self.logger.error(f"Failed to fetch GMU JSON: status {response.status}")
             return self.events
 
-        # Get JSON content from page
-        body_text = await self.page.text_content("body") or ""
-
         try:
-            events_data = json.loads(body_text)
+            events_data = await response.json()
         except json.JSONDecodeError:
-            # Browser may wrap JSON in <pre> tags
-            pre_elem = await self.page.query_selector("pre")
-            if pre_elem:
-                body_text = await self.get_element_text(pre_elem) or ""
-                events_data = json.loads(body_text)
-            else:
-                self.logger.error("Could not parse GMU JSON response")
-                return self.events
+            self.logger.error("Could not parse GMU JSON response")
+            return self.events
 
         if not isinstance(events_data, list):
             self.logger.error("GMU API response is not a list")
@@ -58,13 +78,16 @@ class GMUScraper(BaseScraper):
 
         self.logger.info(f"Found {len(events_data)} GMU events from API")
 
+        # Bound once; the feed can hold a full semester of events
+        parse_event = self._parse_event
+        add_event = self.events.append
         for event_obj in events_data:
             try:
-                if event_obj.get("canceled", False):
+                if event_obj.get("canceled"):
                     continue
-                event = self._parse_event(event_obj)
+                event = parse_event(event_obj)
                 if event:
-                    self.events.append(event)
+                    add_event(event)
             except Exception as e:
                 self.logger.debug(f"Failed to parse GMU event: {e}")
 
@@ -107,7 +130,8 @@ class GMUScraper(BaseScraper):
 
         # Detect location type from description
         location_type = LocationType.HYBRID  # GMU seminars are live-streamed
-        if "virtual" in description_text.lower() and "in-person" not in description_text.lower():
+        description_lower = description_text.lower()
+        if "virtual" in description_lower and "in-person" not in description_lower:
             location_type = LocationType.VIRTUAL
 
         return self.create_event(
@@ -123,46 +147,33 @@ class GMUScraper(BaseScraper):
     def _parse_iso_with_offset(self, dt_str: str, offset: str) -> Optional[datetime]:
         """Parse ISO datetime string with timezone offset, convert to PST."""
         try:
-            # Parse the ISO datetime (e.g., "2026-02-13T11:00:00")
-            dt = datetime.strptime(dt_str, "%Y-%m-%dT%H:%M:%S")
-
-            # Apply timezone offset (e.g., "-0500" for EST)
-            hours = int(offset[:3])
-            minutes = int(offset[0] + offset[3:5])
-            from datetime import timedelta, timezone
-            tz = timezone(timedelta(hours=hours, minutes=minutes))
-            dt = dt.replace(tzinfo=tz)
+            # Parse the ISO datetime (e.g., "2026-02-13T11:00:00") and apply
+            # the timezone offset (e.g., "-0500" for EST)
+            dt = datetime.fromisoformat(dt_str).replace(tzinfo=_offset_tz(offset))
 
             # Convert to PST
-            return dt.astimezone(self.PST)
+            return dt.astimezone(PST)
         except Exception as e:
             self.logger.debug(f"Could not parse datetime '{dt_str}': {e}")
             return None
 
-    def _strip_html(self, html: str) -> str:
+    def _strip_html(self, html_str: str) -> str:
         """Strip HTML tags and decode entities."""
-        if not html:
+        if not html_str:
             return ""
         # Convert block-level tags to newlines
-        text = re.sub(r"<br\s*/?>", "\n", html, flags=re.IGNORECASE)
-        text = re.sub(r"</p>", "\n", text, flags=re.IGNORECASE)
-        text = re.sub(r"</div>", "\n", text, flags=re.IGNORECASE)
-        text = re.sub(r"</li>", "\n", text, flags=re.IGNORECASE)
+        text = _BLOCK_TAG_RE.sub("\n", html_str)
         # Strip remaining HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
-        # Decode HTML entities
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&nbsp;", " ")
-        text = text.replace("&#160;", " ")
-        text = text.replace("&#39;", "'")
-        text = text.replace("&#8217;", "'")
-        text = text.replace("&#8211;", "-")
-        text = text.replace("&quot;", '"')
+        text = _TAG_RE.sub("", text)
+        # Decode HTML entities; the feed double-escapes some ("&amp;lt;")
+        if "&" in text:
+            text = html.unescape(text)
+            if "&" in text:
+                text = html.unescape(text)
+            text = text.replace("\xa0", " ")
         # Collapse whitespace but preserve newlines
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n\s*\n+", "\n", text)
+        text = _SPACES_RE.sub(" ", text)
+        text = _BLANK_LINES_RE.sub("\n", text)
         return text.strip()
 
     def _extract_talk_title(self, text: str) -> Optional[str]:
@@ -185,23 +196,17 @@ class GMUScraper(BaseScraper):
         title_parts = []
         for line in lines:
             # Stop at speaker/location/meta/schedule lines
-            if re.match(
-                r"^(?:Dr\.|Prof\.|Professor |Speaker|Location|"
-                r"This seminar|Abstract|Bio|Register|REGISTER|"
-                r"Please |Join us|Zoom|https?://|"
-                r"Schedule|Come see|Come join|RSVP|\d{1,2}:\d{2}\s*(?:am|pm|AM|PM))",
-                line, re.IGNORECASE
-            ):
+            if _TALK_STOP_RE.match(line):
                 break
             # Stop if line looks like "Name, Position, Department"
-            if re.match(r"^[A-Z][a-z]+\s+[A-Z][a-z]+,\s+", line) and len(title_parts) > 0:
+            if _NAME_POSITION_RE.match(line) and len(title_parts) > 0:
                 break
             title_parts.append(line)
 
         if title_parts:
             title = " ".join(title_parts)
             # Clean up
-            title = re.sub(r"\s+", " ", title).strip()
+            title = _WS_RE.sub(" ", title).strip()
             # If title is too long, it's likely a description, not a title
             if len(title) > 150:
                 return None
@@ -214,23 +219,17 @@ class GMUScraper(BaseScraper):
         """Extract speaker names from description text."""
         speakers = []
 
-        if not text:
+        if not text or not any(k in text for k in _SPEAKER_KEYWORDS):
             return speakers
 
         # Pattern: "Dr. FirstName LastName" or "Prof. FirstName LastName"
-        match = re.search(
-            r"(?:Dr\.|Prof\.|Professor )\s*([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:-[A-Z][a-z]+)?)",
-            text
-        )
+        match = _TITLED_SPEAKER_RE.search(text)
         if match:
             speakers.append(match.group(1).strip())
             return speakers
 
         # Pattern: "Speaker: Name" or "Presented by Name"
-        match = re.search(
-            r"(?:Speaker|Presenter|Presented by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:-[A-Z][a-z]+)?)",
-            text
-        )
+        match = _SPEAKER_RE.search(text)
         if match:
             speakers.append(match.group(1).strip())
 
@@ -4,11 +4,43 @@ Site: https://hsph.harvard.edu/department/epidemiology/seminar-series/
 """
 
 import re
-from typing import List, Optional
+from typing import List, Optional, Dict
+
+from playwright.async_api import Page
 
 from src.scrapers.base import BaseScraper
 from src.models.event import Event, LocationType
 from src.parsers.date_parser import DateParser
+from src.parsers.regex_patterns import MONTHS, DATE_WITH_YEAR_RE
+
+# "1:00 pm - 1:50 pm" / "1:00 pm to 1:50 pm"
+_TIME_RANGE_RE = re.compile(
+    r"(\d{1,2}:\d{2}\s*(?:am|pm))\s*(?:[–-]|to)\s*(\d{1,2}:\d{2}\s*(?:am|pm))",
+    re.IGNORECASE
+)
+# Main event date: "January 28" alone on a (stripped) line
+_DATE_NO_YEAR_RE = re.compile(rf"^({MONTHS})\s+\d{{1,2}}$", re.IGNORECASE)
+# Navigation link titles, matched anywhere in the title (no word boundaries)
+_SKIP_TITLE_RE = re.compile(r"menu|navigation|back|home|view all", re.IGNORECASE)
+_LINE_BREAKS_RE = re.compile(r"[\t\n\r]+")
+# Trailing junk cut from listing titles (institutions, navigation, etc.)
+_TITLE_JUNK_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\s*,?\s*the National Institute.*$",
+        r"\s*,?\s*National Institute.*$",
+        r"\s*,?\s*Information\s*$",
+        r"\s*,?\s*Harvard faculty.*$",
+        r"\s*,?\s*Rishi Desai\s*$",  # Remove duplicate speaker in title
+    )
+)
+_DR_NAME_RE = re.compile(r"Dr\.\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})")
+# Organization/junk names the "Dr." pattern picks up
+_EXCLUDED_SPEAKER_NAMES = frozenset({
+    "the national institute", "national institute", "information",
+    "sentinel innovation", "fda sentinel", "innovation center",
+    "harvard faculty", "harvard t",
+})
 
 
 class HarvardHSPHScraper(BaseScraper):
@@ -28,14 +60,18 @@ class HarvardHSPHScraper(BaseScraper):
         event_urls = await self._collect_event_urls()
         self.logger.info(f"Found {len(event_urls)} event URLs to scrape")
 
-        # Visit each event page to get accurate date
-        for url, title in event_urls:
+        async def scrape_one(page: Page, data: Dict) -> Optional[Event]:
             try:
-                event = await self._scrape_event_page(url, title)
-                if event:
-                    self.events.append(event)
+                return await self._scrape_event_page(page, data["url"], data["title"])
             except Exception as e:
-                self.logger.debug(f"Failed to scrape event page {url}: {e}")
+                self.logger.debug(f"Failed to scrape event page {data['url']}: {e}")
+                return None
+
+        # Visit each event page to get accurate date, over parallel pages;
+        # listing entries unchanged since an earlier run reuse cached events
+        event_data = [{"url": url, "title": title} for url, title in event_urls]
+        events = await self.scrape_detail_pages(event_data, scrape_one)
+        self.events.extend(event for event in events if event)
 
         return self.events
 
@@ -44,44 +80,40 @@ class HarvardHSPHScraper(BaseScraper):
         seen_urls = set()
         event_urls = []
 
-        # Look for event links
-        event_links = await self.get_all_elements(
+        # Look for event links; hrefs and titles of every match come back in
+        # one round trip, so links repeated across selectors cost nothing
+        rows = await self.get_listing_rows(
             'a[href*="/epidemiology/events/"], a[href*="/events/"]'
         )
 
-        for link in event_links:
-            try:
-                href = await self.get_href(link)
-                title = await self.get_element_text(link)
-
-                if not href or not title:
-                    continue
-
-                # Skip if already seen or too short
-                if href in seen_urls or len(title) < 15:
-                    continue
+        for href, title, _, _ in rows:
+            if not href or not title:
+                continue
 
-                # Skip navigation links
-                if any(skip in title.lower() for skip in ["menu", "navigation", "back", "home", "view all"]):
-                    continue
+            # Skip if already seen or too short
+            url_key = self.url_key(href)
+            if url_key in seen_urls or len(title) < 15:
+                continue
 
-                seen_urls.add(href)
-                # Clean the title - remove extra whitespace and truncate at common junk
-                clean_title = self._clean_title(title)
-                event_urls.append((href, clean_title))
+            # Skip navigation links
+            if _SKIP_TITLE_RE.search(title):
+                continue
 
-            except Exception as e:
-                self.logger.debug(f"Failed to extract link: {e}")
+            seen_urls.add(url_key)
+            # Clean the title - remove extra whitespace and truncate at common junk
+            clean_title = self._clean_title(title)
+            event_urls.append((href, clean_title))
 
         return event_urls
 
-    async def _scrape_event_page(self, url: str, title: str) -> Optional[Event]:
+    async def _scrape_event_page(self, page: Page, url: str, title: str) -> Optional[Event]:
         """Scrape individual event page for accurate date/time."""
-        await self.page.goto(url, wait_until="domcontentloaded", timeout=15000)
-        await self.page.wait_for_timeout(1000)
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        await page.wait_for_timeout(1000)
 
-        # Get page content
-        page_text = await self.page.text_content("body") or ""
+        # Get the main content text; the site's menus and footer hold no
+        # event data
+        page_text, _ = await self.get_body_and_text("h1", page=page, scope="main, article")
 
         # Extract date and time from the event page
         date_info = self._extract_date_time(page_text)
@@ -131,20 +163,17 @@ class HarvardHSPHScraper(BaseScraper):
         # 2. "February 11, 2026 @ 1:00 pm – 1:50 pm" for related events (ignore these)
 
         # Look for time pattern first: "1:00 pm" followed by "1:50 pm"
-        time_pattern = r"(\d{1,2}:\d{2}\s*(?:am|pm))\s*(?:[–-]|to)\s*(\d{1,2}:\d{2}\s*(?:am|pm))"
-        time_match = re.search(time_pattern, text, re.IGNORECASE)
+        time_match = _TIME_RANGE_RE.search(text)
 
         # Strategy: Look for date WITHOUT year (the main event date)
         # This date appears on its own line, not as "Month DD, YYYY @ time" format
         lines = text.split('\n')
         for line in lines:
             line = line.strip()
-            # Match "January 28" or "February 11" standalone (not followed by year)
-            if re.match(
-                r"^(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}$",
-                line,
-                re.IGNORECASE
-            ):
+            # Match "January 28" or "February 11" standalone (not followed by year);
+            # such a line ends in a digit, which rules out most lines before
+            # the regex runs
+            if line[-1:].isdecimal() and _DATE_NO_YEAR_RE.match(line):
                 date_text = f"{line}, 2026"
                 if time_match:
                     time_text = f"{time_match.group(1)}-{time_match.group(2)}"
@@ -158,11 +187,7 @@ class HarvardHSPHScraper(BaseScraper):
             # Skip lines that look like related events (contain "@")
             if "@" in line:
                 continue
-            date_with_year = re.search(
-                r"((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})",
-                line,
-                re.IGNORECASE
-            )
+            date_with_year = DATE_WITH_YEAR_RE.search(line)
             if date_with_year:
                 date_text = date_with_year.group(1)
                 if time_match:
@@ -176,48 +201,27 @@ class HarvardHSPHScraper(BaseScraper):
     def _clean_title(self, title: str) -> str:
         """Clean up title text."""
         # Remove tabs, newlines, and multiple spaces
-        title = re.sub(r'[\t\n\r]+', ' ', title)
+        title = _LINE_BREAKS_RE.sub(" ", title)
         title = " ".join(title.split())
 
         # Truncate at common junk patterns (institutions, navigation, etc.)
-        junk_patterns = [
-            r"\s*,?\s*the National Institute.*$",
-            r"\s*,?\s*National Institute.*$",
-            r"\s*,?\s*Information\s*$",
-            r"\s*,?\s*Harvard faculty.*$",
-            r"\s*,?\s*Rishi Desai\s*$",  # Remove duplicate speaker in title
-        ]
-        for pattern in junk_patterns:
-            title = re.sub(pattern, "", title, flags=re.IGNORECASE)
+        for junk_re in _TITLE_JUNK_RES:
+            title = junk_re.sub("", title)
 
         return title.strip()
 
     def _extract_speakers(self, text: str) -> List[str]:
         """Extract speaker names from context text."""
-        speakers = []
-
-        # Organization/junk names to exclude
-        exclude_names = {
-            "the national institute", "national institute", "information",
-            "sentinel innovation", "fda sentinel", "innovation center",
-            "harvard faculty", "harvard t",
-        }
-
-        # Look for "Dr. FirstName LastName" pattern
-        dr_pattern = r"Dr\.\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})"
-        matches = re.findall(dr_pattern, text)
-        for match in matches:
-            if match.lower() not in exclude_names:
-                speakers.append(f"Dr. {match}")
-
-        # Dedupe speakers by base name (e.g., "Dr. Rishi Desai" and "Rishi Desai" -> keep "Dr." version)
-        unique_speakers = []
-        seen_names = set()
-        for speaker in speakers:
-            # Extract the base name without title
-            base_name = re.sub(r"^Dr\.\s*", "", speaker).lower()
-            if base_name not in seen_names:
-                seen_names.add(base_name)
-                unique_speakers.append(speaker)
-
-        return unique_speakers[:2]  # Limit to 2 speakers
+        # Look for "Dr. FirstName LastName" pattern, deduped by base name
+        # (e.g. "Dr. Rishi Desai" twice -> one entry), keeping the first two
+        speakers = {}
+        for match in _DR_NAME_RE.finditer(text):
+            name = match.group(1)
+            base_name = name.lower()
+            if base_name in _EXCLUDED_SPEAKER_NAMES or base_name in speakers:
+                continue
+            speakers[base_name] = f"Dr. {name}"
+            if len(speakers) == 2:  # Limit to 2 speakers
+                break
+
+        return list(speakers.values())
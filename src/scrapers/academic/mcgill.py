@@ -7,9 +7,41 @@ import re
 import asyncio
 from typing import List, Optional, Dict
 
+from playwright.async_api import Page
+
 from src.scrapers.base import BaseScraper
 from src.models.event import Event, LocationType
 from src.parsers.date_parser import DateParser
+from src.parsers.regex_patterns import MONTHS, WEEKDAYS
+from src.utils.scrape_cache import DetailPageCache
+
+# Optional "3:30 pm" / "3:30 pm - 4:30 pm" after a date
+_TIME_SUFFIX = r"\d{1,2}:\d{2}\s*(?:am|pm)(?:\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm))?"
+
+# "February 4, 2026" with optional "at" time
+_DATE_RE = re.compile(
+    rf"((?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}})(?:\s+(?:at\s+)?({_TIME_SUFFIX}))?",
+    re.IGNORECASE
+)
+# "Tuesday, February 4, 2026 3:30 PM - 4:30 PM"
+_WEEKDAY_DATE_RE = re.compile(
+    rf"(?:{WEEKDAYS}),?\s+"
+    rf"((?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}})(?:\s+({_TIME_SUFFIX}))?",
+    re.IGNORECASE
+)
+# "4 February 2026"
+_EURO_DATE_RE = re.compile(rf"(\d{{1,2}}\s+(?:{MONTHS})\s+\d{{4}})", re.IGNORECASE)
+# Navigation link titles, matched anywhere in the title (no word boundaries)
+_SKIP_TITLE_RE = re.compile(
+    r"menu|back|home|view all|biostatistics seminar|seminars & events", re.IGNORECASE
+)
+_TZ_RE = re.compile(r"\b(?:ET|EST|EDT|PST|PDT|CT|CST|CDT)\b", re.IGNORECASE)
+# Trailing "(Speaker Name)" on a seminar title
+_TITLE_SPEAKER_RE = re.compile(r"\(([^)]+)\)\s*$")
+_TITLE_SPEAKER_STRIP_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_SPEAKER_RE = re.compile(
+    r"(?:Speaker|Presenter|Presented by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)"
+)
 
 
 class McGillScraper(BaseScraper):
@@ -18,6 +50,28 @@ class McGillScraper(BaseScraper):
     SOURCE_NAME = "McGill University Biostatistics Seminars"
     BASE_URL = "https://www.mcgill.ca/epi-biostat-occh/seminars-events/seminars/biostatistics"
 
+    # McGill answers bursts of requests with HTTP 429: keep at most two
+    # detail pages in flight and start their loads this far apart (the same
+    # 3s gap the sequential loop used to sleep between pages)
+    MAX_PARALLEL_PAGES = 2
+    REQUEST_INTERVAL_SEC = 3.0
+
+    # Fewer detail pages than other sources, for the same reason
+    MAX_EVENTS_PER_SOURCE = 10
+
+    def __init__(self, page: Page, detail_cache: Optional[DetailPageCache] = None):
+        """
+        Initialize scraper with a Playwright page.
+
+        Args:
+            page: Playwright page instance
+            detail_cache: Optional cache of events parsed from detail pages
+        """
+        super().__init__(page, detail_cache=detail_cache)
+        # Shared by every detail page load to space out requests
+        self._request_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
     async def scrape(self) -> List[Event]:
         """Scrape McGill Biostatistics seminar listings."""
         await self.navigate_to_page()
@@ -28,94 +82,99 @@ class McGillScraper(BaseScraper):
         event_data = await self._collect_event_urls()
         self.logger.info(f"Found {len(event_data)} McGill events to process")
 
-        # Visit each event page with rate limiting (McGill may return 429)
-        for data in event_data[:10]:
+        async def scrape_one(page: Page, data: Dict) -> Optional[Event]:
             try:
-                event = await self._scrape_event_page(data)
-                if event:
-                    self.events.append(event)
-                # Rate limit: wait between requests to avoid 429
-                await asyncio.sleep(3)
+                return await self._scrape_event_page(page, data)
             except Exception as e:
                 self.logger.warning(f"Failed to parse McGill event {data.get('url')}: {e}")
+                return None
+
+        # Visit each event page with rate limiting (McGill may return 429);
+        # listing entries unchanged since an earlier run reuse cached events
+        events = await self.scrape_detail_pages(event_data, scrape_one)
+        self.events.extend(event for event in events if event)
 
         return self.events
 
+    async def _wait_for_request_slot(self) -> None:
+        """Wait until REQUEST_INTERVAL_SEC has passed since the last page load started."""
+        loop = asyncio.get_running_loop()
+        async with self._request_lock:
+            delay = self._next_request_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_request_at = loop.time() + self.REQUEST_INTERVAL_SEC
+
     async def _collect_event_urls(self) -> List[Dict]:
         """Collect event URLs from the listing page."""
         event_data = []
         seen_urls = set()
 
-        # McGill Drupal views - try multiple selectors
-        links = await self.get_all_elements(
+        # McGill Drupal views - try multiple selectors; each link comes back
+        # with its row's text (for the listing date) in one round trip
+        rows = await self.get_links_with_context(
             ".views-row a, a[href*='/channels/event/'], "
-            ".views-field-title a, a[href*='/epi-biostat-occh/']"
+            ".views-field-title a, a[href*='/epi-biostat-occh/']",
+            ".views-row",
         )
 
-        for link in links:
-            try:
-                href = await self.get_href(link)
-                title = await self.get_element_text(link)
-
-                if not href or not title or len(title) < 10:
-                    continue
+        for href, title, row_text in rows:
+            if not href or not title or len(title) < 10:
+                continue
 
-                if href in seen_urls:
-                    continue
+            url_key = self.url_key(href)
+            if url_key in seen_urls:
+                continue
 
-                # Only follow event detail links
-                if not any(p in href for p in ["/channels/event/", "/seminars/", "/epi-biostat-occh/"]):
-                    continue
+            # Only follow event detail links
+            if not any(p in href for p in ["/channels/event/", "/seminars/", "/epi-biostat-occh/"]):
+                continue
 
-                # Skip the listing page itself and navigation
-                if href.rstrip("/") == self.BASE_URL.rstrip("/"):
-                    continue
+            # Skip the listing page itself and navigation
+            if href.rstrip("/") == self.BASE_URL.rstrip("/"):
+                continue
 
-                if any(skip in title.lower() for skip in [
-                    "menu", "back", "home", "view all", "biostatistics seminar",
-                    "seminars & events"
-                ]):
-                    continue
+            if _SKIP_TITLE_RE.search(title):
+                continue
 
-                seen_urls.add(href)
+            seen_urls.add(url_key)
 
-                # Try to get date from listing page context
-                parent = await link.evaluate_handle("el => el.closest('.views-row')")
-                date_text = None
-                if parent:
-                    date_elem_text = await parent.evaluate("el => el?.textContent || ''")
-                    date_text = self._extract_date(date_elem_text)
+            # Try to get date from listing page context
+            date_text = self._extract_date(row_text) if row_text else None
 
-                event_data.append({
-                    "title": title.strip(),
-                    "url": href,
-                    "date_text": date_text,
-                })
-
-            except Exception as e:
-                self.logger.debug(f"Failed to collect event URL: {e}")
+            event_data.append({
+                "title": title.strip(),
+                "url": href,
+                "date_text": date_text,
+            })
+            if len(event_data) >= self.MAX_EVENTS_PER_SOURCE:
+                break
 
         return event_data
 
-    async def _scrape_event_page(self, data: Dict) -> Optional[Event]:
+    async def _scrape_event_page(self, page: Page, data: Dict) -> Optional[Event]:
         """Scrape individual event page for details."""
         url = data["url"]
         title = data["title"]
         date_text = data.get("date_text")
 
-        await self.navigate_to_page(url)
+        await self._wait_for_request_slot()
+        await self.navigate_to_page(url, page=page)
 
-        body_text = await self.page.text_content("body") or ""
-
-        # Try to get a better title from h1
-        h1_title = await self.get_text("h1, .page-title, #page-title")
+        # Get the main content text and the h1 (for a better title) in one
+        # round trip
+        body_text, h1_title = await self.get_body_and_text(
+            "h1, .page-title, #page-title", page=page, scope="main, article"
+        )
         if h1_title and len(h1_title) > 10:
             title = h1_title.strip()
 
         # Extract date from detail page if not from listing
         if not date_text:
             # Try date-display-single first (Drupal)
-            date_elem = await self.get_text(".date-display-single, .field-name-field-date, time")
+            date_elem = await self.get_text(
+                ".date-display-single, .field-name-field-date, time", page=page
+            )
             if date_elem:
                 date_text = date_elem
             else:
@@ -126,7 +185,7 @@ class McGillScraper(BaseScraper):
             return None
 
         # Add ET timezone if none detected (McGill is in Eastern)
-        if not re.search(r"\b(?:ET|EST|EDT|PST|PDT|CT|CST|CDT)\b", date_text, re.IGNORECASE):
+        if not _TZ_RE.search(date_text):
             date_text = f"{date_text} ET"
 
         try:
@@ -139,7 +198,7 @@ class McGillScraper(BaseScraper):
         speakers = self._extract_speakers(title, body_text)
 
         # Clean title (remove speaker parenthetical)
-        clean_title = re.sub(r"\s*\([^)]*\)\s*$", "", title).strip()
+        clean_title = _TITLE_SPEAKER_STRIP_RE.sub("", title).strip()
 
         return self.create_event(
             title=clean_title,
@@ -155,36 +214,21 @@ class McGillScraper(BaseScraper):
     def _extract_date(self, text: str) -> Optional[str]:
         """Extract date and time from text."""
         # Pattern: "February 4, 2026" with optional time
-        match = re.search(
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{1,2},?\s+\d{4})"
-            r"(?:\s+(?:at\s+)?(\d{1,2}:\d{2}\s*(?:am|pm)(?:\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm))?))?",
-            text, re.IGNORECASE
-        )
+        match = _DATE_RE.search(text)
         if match:
             date_str = match.group(1)
             time_str = match.group(2) or ""
             return f"{date_str} {time_str}".strip()
 
         # Pattern: "Tuesday, February 4, 2026 3:30 PM - 4:30 PM"
-        match = re.search(
-            r"(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+"
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{1,2},?\s+\d{4})"
-            r"(?:\s+(\d{1,2}:\d{2}\s*(?:am|pm)(?:\s*[-–]\s*\d{1,2}:\d{2}\s*(?:am|pm))?))?",
-            text, re.IGNORECASE
-        )
+        match = _WEEKDAY_DATE_RE.search(text)
         if match:
             date_str = match.group(1)
             time_str = match.group(2) or ""
             return f"{date_str} {time_str}".strip()
 
         # Pattern: "4 February 2026" (European format)
-        match = re.search(
-            r"(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{4})",
-            text, re.IGNORECASE
-        )
+        match = _EURO_DATE_RE.search(text)
         if match:
             return match.group(1)
 
@@ -195,17 +239,14 @@ class McGillScraper(BaseScraper):
         speakers = []
 
         # Check title for parenthetical speaker name: "Title (Speaker Name)"
-        match = re.search(r"\(([^)]+)\)\s*$", title)
+        match = _TITLE_SPEAKER_RE.search(title)
         if match:
             potential = match.group(1)
             if len(potential) < 80 and any(c.isupper() for c in potential):
                 return self.parse_speakers(potential)
 
         # Check body for "Speaker:" or "Presenter:" patterns
-        match = re.search(
-            r"(?:Speaker|Presenter|Presented by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-            body_text
-        )
+        match = _SPEAKER_RE.search(body_text)
         if match:
             speakers.append(match.group(1).strip())
 
@@ -6,9 +6,47 @@ Site: https://epibiostat.ucsf.edu/events
 import re
 from typing import List, Optional, Dict
 
+from playwright.async_api import Page
+
 from src.scrapers.base import BaseScraper
 from src.models.event import Event, LocationType
 from src.parsers.date_parser import DateParser
+from src.parsers.regex_patterns import MONTH_NAMES_LOWER, MONTHS, WEEKDAYS, DATE_WITH_YEAR_RE
+
+# "Date: February 5, 2026" or "Date February 5, 2026"
+_LABELED_DATE_RE = re.compile(r"Date[:\s]+(\w+\s+\d{1,2},?\s+\d{4})", re.IGNORECASE)
+# "Wednesday, February 5, 2026"
+_WEEKDAY_DATE_RE = re.compile(
+    rf"(?:{WEEKDAYS}),?\s+"
+    rf"((?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}})",
+    re.IGNORECASE
+)
+# "1:00pm-2:00pm" / "1:00 PM - 2:00 PM"
+_CLOCK_RANGE = r"\d{1,2}:\d{2}\s*[ap]\.?m\.?\s*[-–]\s*\d{1,2}:\d{2}\s*[ap]\.?m\.?"
+# "1 to 2 p.m." / "1-2 pm"
+_WORD_RANGE = r"\d{1,2}(?::\d{2})?\s*(?:[ap]\.?m\.?)?\s*(?:to|-|–)\s*\d{1,2}(?::\d{2})?\s*[ap]\.?m\.?"
+_LABELED_TIME_RE = re.compile(
+    r"Time[:\s]+(\d{1,2}:\d{2}\s*[ap]\.?m\.?\s*[-–to]+\s*\d{1,2}:\d{2}\s*[ap]\.?m\.?)",
+    re.IGNORECASE
+)
+_LABELED_WORD_TIME_RE = re.compile(rf"Time[:\s]+({_WORD_RANGE})", re.IGNORECASE)
+_TIME_RANGE_RE = re.compile(rf"({_CLOCK_RANGE})", re.IGNORECASE)
+_WORD_TIME_RE = re.compile(rf"({_WORD_RANGE})", re.IGNORECASE)
+# Navigation link titles, matched anywhere in the title (no word boundaries)
+_SKIP_TITLE_RE = re.compile(r"menu|back|home|view all|more events", re.IGNORECASE)
+# _normalize_time rewrites
+_AMPM_DOTS_RE = re.compile(r"([ap])\.m\.", re.IGNORECASE)
+_TO_RE = re.compile(r"\s+to\s+")
+_BARE_HOUR_RE = re.compile(r"\b(\d{1,2})\s*(am|pm)", re.IGNORECASE)
+_SPEAKER_RE = re.compile(
+    r"(?:Speaker|Presenter)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)"
+)
+_SPEAKER_KEYWORDS = ("Speaker", "Presenter")
+# "by Name" at the start of a line
+_BY_SPEAKER_RE = re.compile(
+    r"(?:^|\n)\s*(?:by|presented by)\s+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)",
+    re.IGNORECASE | re.MULTILINE
+)
 
 
 class UCSFScraper(BaseScraper):
@@ -27,14 +65,17 @@ class UCSFScraper(BaseScraper):
         event_data = await self._collect_event_urls()
         self.logger.info(f"Found {len(event_data)} UCSF events to process")
 
-        # Visit each event page for details
-        for data in event_data[:15]:
+        async def scrape_one(page: Page, data: Dict) -> Optional[Event]:
             try:
-                event = await self._scrape_event_page(data)
-                if event:
-                    self.events.append(event)
+                return await self._scrape_event_page(page, data)
             except Exception as e:
                 self.logger.warning(f"Failed to parse UCSF event {data.get('url')}: {e}")
+                return None
+
+        # Visit each event page for details, over parallel pages; listing
+        # entries unchanged since an earlier run reuse cached events
+        events = await self.scrape_detail_pages(event_data, scrape_one)
+        self.events.extend(event for event in events if event)
 
         return self.events
 
@@ -43,50 +84,48 @@ class UCSFScraper(BaseScraper):
         event_data = []
         seen_urls = set()
 
-        # UCSF Drupal site uses /content/ paths for event detail pages
-        links = await self.get_all_elements(
+        # UCSF Drupal site uses /content/ paths for event detail pages; the
+        # same link often matches several selectors, and all of them come
+        # back in one round trip
+        rows = await self.get_listing_rows(
             "a[href*='/content/'], .views-row a, .views-field-title a"
         )
 
-        for link in links:
-            try:
-                href = await self.get_href(link)
-                title = await self.get_element_text(link)
-
-                if not href or not title or len(title) < 10:
-                    continue
+        for href, title, _, _ in rows:
+            if not href or not title or len(title) < 10:
+                continue
 
-                if href in seen_urls:
-                    continue
+            url_key = self.url_key(href)
+            if url_key in seen_urls:
+                continue
 
-                # Only follow detail page links
-                if "/content/" not in href and "/events/" not in href:
-                    continue
+            # Only follow detail page links
+            if "/content/" not in href and "/events/" not in href:
+                continue
 
-                # Skip navigation-like links
-                if any(skip in title.lower() for skip in ["menu", "back", "home", "view all", "more events"]):
-                    continue
+            # Skip navigation-like links
+            if _SKIP_TITLE_RE.search(title):
+                continue
 
-                seen_urls.add(href)
-                event_data.append({"title": title, "url": href})
-
-            except Exception as e:
-                self.logger.debug(f"Failed to collect event URL: {e}")
+            seen_urls.add(url_key)
+            event_data.append({"title": title, "url": href})
+            if len(event_data) >= self.MAX_EVENTS_PER_SOURCE:
+                break
 
         return event_data
 
-    async def _scrape_event_page(self, data: Dict) -> Optional[Event]:
+    async def _scrape_event_page(self, page: Page, data: Dict) -> Optional[Event]:
         """Scrape individual event page for details."""
         url = data["url"]
         title = data["title"]
 
-        await self.navigate_to_page(url)
+        await self.navigate_to_page(url, page=page)
 
-        # Get page text
-        body_text = await self.page.text_content("body") or ""
-
-        # Try to get a better title from h1
-        h1_title = await self.get_text("h1")
+        # Get the main content text and the h1 (for a better title) in one
+        # round trip
+        body_text, h1_title = await self.get_body_and_text(
+            "h1", page=page, scope="main, article"
+        )
         if h1_title and len(h1_title) > 10:
             title = h1_title.strip()
 
@@ -124,30 +163,25 @@ class UCSFScraper(BaseScraper):
 
     def _extract_date(self, text: str) -> Optional[str]:
         """Extract date from page text using various patterns."""
+        text_lower = text.lower()
+
         # Pattern: "Date: February 5, 2026" or "Date February 5, 2026"
-        match = re.search(
-            r"Date[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
-            text, re.IGNORECASE
-        )
+        match = "date" in text_lower and _LABELED_DATE_RE.search(text)
         if match:
             return match.group(1)
 
+        # Both remaining patterns need a month name; skip the scans when none
+        # is present
+        if not any(month in text_lower for month in MONTH_NAMES_LOWER):
+            return None
+
         # Pattern: "Wednesday, February 5, 2026"
-        match = re.search(
-            r"(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+"
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{1,2},?\s+\d{4})",
-            text, re.IGNORECASE
-        )
+        match = _WEEKDAY_DATE_RE.search(text)
         if match:
             return match.group(1)
 
         # Pattern: standalone "February 5, 2026"
-        match = re.search(
-            r"((?:January|February|March|April|May|June|July|August|September|October|November|December)"
-            r"\s+\d{1,2},?\s+\d{4})",
-            text, re.IGNORECASE
-        )
+        match = DATE_WITH_YEAR_RE.search(text)
         if match:
             return match.group(1)
 
@@ -155,77 +189,59 @@ class UCSFScraper(BaseScraper):
 
     def _extract_time(self, text: str) -> str:
         """Extract time from page text, normalizing formats like '1 to 2 p.m.'."""
-        # Pattern: "Time: 1:00pm-2:00pm" or "Time: 1:00 PM - 2:00 PM"
-        match = re.search(
-            r"Time[:\s]+(\d{1,2}:\d{2}\s*[ap]\.?m\.?\s*[-–to]+\s*\d{1,2}:\d{2}\s*[ap]\.?m\.?)",
-            text, re.IGNORECASE
-        )
-        if match:
-            return self._normalize_time(match.group(1))
-
-        # Pattern: "Time: 1 to 2 p.m." or "1 to 2 pm"
-        match = re.search(
-            r"Time[:\s]+(\d{1,2}(?::\d{2})?\s*(?:[ap]\.?m\.?)?\s*(?:to|-|–)\s*\d{1,2}(?::\d{2})?\s*[ap]\.?m\.?)",
-            text, re.IGNORECASE
-        )
-        if match:
-            return self._normalize_time(match.group(1))
-
-        # Pattern: standalone time range "1:00pm-2:00pm"
-        match = re.search(
-            r"(\d{1,2}:\d{2}\s*[ap]\.?m\.?\s*[-–]\s*\d{1,2}:\d{2}\s*[ap]\.?m\.?)",
-            text, re.IGNORECASE
-        )
-        if match:
-            return self._normalize_time(match.group(1))
-
-        # Pattern: "1 to 2 p.m." or "1-2 p.m."
-        match = re.search(
-            r"(\d{1,2}(?::\d{2})?\s*(?:[ap]\.?m\.?)?\s*(?:to|-|–)\s*\d{1,2}(?::\d{2})?\s*[ap]\.?m\.?)",
-            text, re.IGNORECASE
-        )
-        if match:
-            return self._normalize_time(match.group(1))
-
-        return ""
+        # The two labeled patterns only run when "time" occurs at all
+        if "time" in text.lower():
+            # Pattern: "Time: 1:00pm-2:00pm" or "Time: 1:00 PM - 2:00 PM"
+            match = _LABELED_TIME_RE.search(text)
+            if match:
+                return self._normalize_time(match.group(1))
+
+            # Pattern: "Time: 1 to 2 p.m." or "1 to 2 pm"
+            match = _LABELED_WORD_TIME_RE.search(text)
+            if match:
+                return self._normalize_time(match.group(1))
+
+        # Pattern: "1 to 2 p.m." or "1-2 p.m."; it also matches wherever the
+        # stricter "1:00pm-2:00pm" does, so without it neither pattern can
+        # match, and the stricter one can start its scan at this match
+        word_match = _WORD_TIME_RE.search(text)
+        if not word_match:
+            return ""
+
+        # Pattern: standalone time range "1:00pm-2:00pm" (preferred)
+        match = _TIME_RANGE_RE.search(text, word_match.start())
+        return self._normalize_time((match or word_match).group(1))
 
     def _normalize_time(self, time_str: str) -> str:
         """Normalize time strings like '1 to 2 p.m.' to '1:00pm-2:00pm'."""
         # Remove periods from am/pm
-        time_str = re.sub(r"([ap])\.m\.", r"\1m", time_str, flags=re.IGNORECASE)
+        if "." in time_str:
+            time_str = _AMPM_DOTS_RE.sub(r"\1m", time_str)
         # Replace "to" with "-"
-        time_str = re.sub(r"\s+to\s+", "-", time_str)
+        if "to" in time_str:
+            time_str = _TO_RE.sub("-", time_str)
         # Normalize dashes
         time_str = time_str.replace("–", "-")
 
         # Add :00 to bare hours like "1pm" -> "1:00pm"
-        time_str = re.sub(r"\b(\d{1,2})\s*(am|pm)", r"\1:00\2", time_str, flags=re.IGNORECASE)
-        # Handle start time without am/pm: "1:00-2:00pm" -> "1:00pm-2:00pm" (infer from end)
-        time_str = re.sub(r"(\d{1,2}:\d{2})\s*-\s*", r"\1-", time_str)
+        time_str = _BARE_HOUR_RE.sub(r"\1:00\2", time_str)
 
-        # Clean up spaces
-        time_str = re.sub(r"\s+", "", time_str)
-
-        return time_str
+        # Clean up spaces (this also closes up "1:00 - 2:00pm" around the dash)
+        return "".join(time_str.split())
 
     def _extract_speakers(self, text: str) -> List[str]:
         """Extract speaker names from page text."""
         speakers = []
 
-        # Pattern: "Speaker: Name" or "Presenter: Name"
-        match = re.search(
-            r"(?:Speaker|Presenter)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-            text
-        )
+        # Pattern: "Speaker: Name" or "Presenter: Name" (keyword check skips
+        # the regex scan on bodies that cannot match)
+        match = any(k in text for k in _SPEAKER_KEYWORDS) and _SPEAKER_RE.search(text)
         if match:
             speakers.append(match.group(1).strip())
             return speakers
 
         # Pattern: "by Name" near title
-        match = re.search(
-            r"(?:^|\n)\s*(?:by|presented by)\s+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)",
-            text, re.IGNORECASE | re.MULTILINE
-        )
+        match = _BY_SPEAKER_RE.search(text)
         if match:
             speakers.append(match.group(1).strip())
 
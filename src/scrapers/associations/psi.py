@@ -6,6 +6,8 @@ Site: https://www.psiweb.org/events/psi-events
 import re
 from typing import List, Optional
 
+from playwright.async_api import Page
+
 from src.scrapers.base import BaseScraper
 from src.models.event import Event, LocationType
 from src.parsers.date_parser import DateParser
@@ -28,16 +30,15 @@ class PSIScraper(BaseScraper):
         event_urls = await self._collect_event_urls()
         self.logger.info(f"Found {len(event_urls)} PSI event URLs")
 
-        # Visit each event page for full details including times
-        for url, title in event_urls:
-            try:
-                event = await self._scrape_event_page(url, title)
-                if event:
-                    # Avoid duplicates
-                    if not any(e.url == event.url for e in self.events):
-                        self.events.append(event)
-            except Exception as e:
-                self.logger.debug(f"Failed to scrape PSI event {url}: {e}")
+        # Visit event pages concurrently for full details including times
+        events = await self.scrape_concurrently(
+            event_urls,
+            lambda page, item: self._scrape_event_page(page, *item),
+        )
+        for event in events:
+            # Avoid duplicates
+            if event and not any(e.url == event.url for e in self.events):
+                self.events.append(event)
 
         return self.events
 
@@ -79,12 +80,14 @@ class PSIScraper(BaseScraper):
 
         return event_urls
 
-    async def _scrape_event_page(self, url: str, title: str) -> Optional[Event]:
+    async def _scrape_event_page(
+        self, page: Page, url: str, title: str
+    ) -> Optional[Event]:
         """Scrape individual event page for full details including time."""
-        await self.page.goto(url, wait_until="domcontentloaded", timeout=15000)
-        await self.page.wait_for_timeout(1000)
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        await page.wait_for_timeout(1000)
 
-        body_text = await self.page.text_content("body") or ""
+        body_text = await page.text_content("body") or ""
 
         # Extract date - first try page content, then URL
         date_text = self._extract_date(body_text)
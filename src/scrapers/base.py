@@ -2,19 +2,55 @@
 Abstract base class for all site-specific scrapers.
 """
 
+import asyncio
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
 from playwright.async_api import Page, ElementHandle
 
 from src.models.event import Event, LocationType
+from src.core.browser import PagePool
 from src.core.exceptions import SiteUnreachableError
 from src.utils.retry import async_retry
+from src.utils.scrape_cache import DetailPageCache
 
 logger = logging.getLogger(__name__)
 
+# Body textContent plus the first match of a selector, in one evaluate() round
+# trip. With a scope selector the first scope match stands in for the body,
+# unless it is missing or holds under 200 non-blank characters.
+_BODY_AND_TEXT_JS = """([selector, scope]) => {
+    const el = document.querySelector(selector);
+    const scopeEl = scope ? document.querySelector(scope) : null;
+    let text = scopeEl ? scopeEl.textContent : "";
+    if (text.trim().length < 200) text = document.body ? document.body.textContent : "";
+    return [text, el ? el.textContent : null];
+}"""
+
+# For each matched item: [link href attribute, link text, date text, category
+# text], where the link/date/category elements are looked up inside the item
+# (null link selector = the item itself)
+_LISTING_ROWS_JS = """(items, [linkSelector, ...textSelectors]) => items.map((item) => {
+    const link = linkSelector ? item.querySelector(linkSelector) : item;
+    if (!link) return null;
+    const texts = textSelectors.map((selector) => {
+        const el = selector ? item.querySelector(selector) : null;
+        return el ? el.textContent : null;
+    });
+    return [link.getAttribute("href"), link.textContent, ...texts];
+}).filter((row) => row !== null)"""
+
+# For each matched link: [href attribute, link text, text of the link's closest
+# ancestor matching the context selector (null when there is none)]
+_LINK_CONTEXT_JS = """(links, contextSelector) => links.map((link) => {
+    const context = link.closest(contextSelector);
+    return [link.getAttribute("href"), link.textContent, context ? context.textContent : null];
+})"""
+
 
 class BaseScraper(ABC):
     """Abstract base class for all site-specific scrapers."""
@@ -23,14 +59,26 @@ class BaseScraper(ABC):
     SOURCE_NAME: str = ""  # e.g., "Harvard HSPH"
     BASE_URL: str = ""  # e.g., "https://www.hsph.harvard.edu/..."
 
-    def __init__(self, page: Page):
+    # Number of pages used to fetch detail pages concurrently
+    MAX_PARALLEL_PAGES: int = 3
+
+    # Listing entries followed to detail pages; listing loops stop here
+    MAX_EVENTS_PER_SOURCE: int = 15
+
+    # Server-rendered sites: the HTML is complete at DOMContentLoaded, so
+    # navigate_to_page need not wait for the network to go idle
+    STATIC_HTML: bool = False
+
+    def __init__(self, page: Page, detail_cache: Optional[DetailPageCache] = None):
         """
         Initialize scraper with a Playwright page.
 
         Args:
             page: Playwright page instance
+            detail_cache: Optional cache of events parsed from detail pages
         """
         self.page = page
+        self.detail_cache = detail_cache
         self.events: List[Event] = []
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
@@ -45,15 +93,18 @@ class BaseScraper(ABC):
         pass
 
     @async_retry(max_attempts=3, delay=2.0, backoff=2.0)
-    async def navigate_to_page(self, url: Optional[str] = None) -> None:
-        """Navigate to the target URL with retry logic."""
+    async def navigate_to_page(
+        self, url: Optional[str] = None, page: Optional[Page] = None
+    ) -> None:
+        """Navigate to the target URL with retry logic (on page, default self.page)."""
         target_url = url or self.BASE_URL
-        self.logger.info(f"Navigating to {target_url}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Navigating to {target_url}")
 
         try:
-            response = await self.page.goto(
+            response = await (page or self.page).goto(
                 target_url,
-                wait_until="networkidle",
+                wait_until="domcontentloaded" if self.STATIC_HTML else "networkidle",
                 timeout=30000,
             )
             if response and response.status >= 400:
@@ -62,6 +113,102 @@ class BaseScraper(ABC):
             self.logger.error(f"Failed to navigate to {target_url}: {e}")
             raise SiteUnreachableError(str(e))
 
+    @asynccontextmanager
+    async def open_page_pool(self, size: int) -> PagePool:
+        """
+        Open a pool of up to size extra pages in this scraper's browser context.
+
+        Pages share the context of self.page, so they reuse its cookies and
+        resource blocking and do not take contexts from the browser pool.
+        """
+        pool = PagePool(self.page.context, size)
+        try:
+            yield pool
+        finally:
+            await pool.close()
+
+    async def scrape_concurrently(
+        self,
+        items: Sequence[Any],
+        scrape_one: Callable[[Page, Any], Awaitable[Any]],
+    ) -> List[Any]:
+        """
+        Run scrape_one(page, item) for each item over parallel pages.
+
+        Items lease pages from a pool of MAX_PARALLEL_PAGES, in order, so
+        a slow page never holds up a whole batch.
+
+        Args:
+            items: Items to scrape (e.g. detail page URLs)
+            scrape_one: Coroutine function taking (page, item)
+
+        Returns:
+            Results in item order; None where scrape_one raised
+        """
+        results: List[Any] = [None] * len(items)
+        if not items:
+            return results
+
+        async def run(pool: PagePool, i: int) -> None:
+            async with pool.acquire() as page:
+                try:
+                    results[i] = await scrape_one(page, items[i])
+                except Exception as e:
+                    self.logger.debug(f"Failed to scrape item {items[i]!r}: {e}")
+
+        # run() handles per-item errors itself, so the task group only
+        # unwinds early on cancellation, which then reaches every item
+        n_pages = min(self.MAX_PARALLEL_PAGES, len(items))
+        async with self.open_page_pool(n_pages) as pool:
+            async with asyncio.TaskGroup() as tg:
+                for i in range(len(items)):
+                    tg.create_task(run(pool, i))
+
+        return results
+
+    async def scrape_detail_pages(
+        self,
+        items: Sequence[Dict],
+        scrape_one: Callable[[Page, Dict], Awaitable[Optional[Event]]],
+    ) -> List[Optional[Event]]:
+        """
+        Like scrape_concurrently, but reuse events cached from earlier runs.
+
+        Items are listing dicts (url, title, ...); an item whose exact data
+        has a cached event skips its page visit. Newly scraped events are
+        added to the cache.
+
+        Args:
+            items: Listing dicts, one per detail page
+            scrape_one: Coroutine function taking (page, item)
+
+        Returns:
+            Events in item order; None where nothing was scraped
+        """
+        if self.detail_cache is None:
+            return await self.scrape_concurrently(items, scrape_one)
+
+        cached = self.detail_cache.get(self.SOURCE_NAME)
+        keys = [tuple(sorted(item.items())) for item in items]
+        results = [cached.get(key) for key in keys]
+
+        missing = [i for i, event in enumerate(results) if event is None]
+        scraped = await self.scrape_concurrently([items[i] for i in missing], scrape_one)
+
+        new_events = {}
+        for i, event in zip(missing, scraped):
+            results[i] = event
+            if event is not None:
+                new_events[keys[i]] = event
+        if new_events:
+            self.detail_cache.put(self.SOURCE_NAME, new_events)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Detail pages: {len(items) - len(missing)} cached, {len(missing)} scraped"
+            )
+        return results
+
     async def wait_for_content(self, selector: str, timeout: int = 10000) -> bool:
         """
         Wait for specific content to be rendered.
@@ -80,10 +227,10 @@ class BaseScraper(ABC):
             self.logger.warning(f"Timeout waiting for selector '{selector}': {e}")
             return False
 
-    async def get_text(self, selector: str) -> Optional[str]:
-        """Safely extract text from a selector."""
+    async def get_text(self, selector: str, page: Optional[Page] = None) -> Optional[str]:
+        """Safely extract text from a selector (on page, default self.page)."""
         try:
-            element = await self.page.query_selector(selector)
+            element = await (page or self.page).query_selector(selector)
             if element:
                 text = await element.text_content()
                 return text.strip() if text else None
@@ -91,6 +238,100 @@ class BaseScraper(ABC):
             self.logger.debug(f"Could not get text for '{selector}': {e}")
         return None
 
+    async def get_body_and_text(
+        self,
+        selector: str,
+        page: Optional[Page] = None,
+        scope: Optional[str] = None,
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Get the page body text and the text of the first selector match.
+
+        Same values as text_content("body") and get_text(selector), but
+        fetched in a single browser round trip.
+
+        Args:
+            selector: CSS selector for the secondary element (e.g. "h1")
+            page: Page to read (defaults to self.page)
+            scope: Optional CSS selector for the main content element (e.g.
+                "main, article"); its text is returned instead of the whole
+                body, which skips navigation and footer text. Falls back to
+                the body when it is missing or nearly empty.
+
+        Returns:
+            Tuple of (body_text, stripped element text or None)
+        """
+        body_text, text = await (page or self.page).evaluate(
+            _BODY_AND_TEXT_JS, [selector, scope]
+        )
+        text = text.strip() if text else None
+        return body_text or "", text or None
+
+    async def get_listing_rows(
+        self,
+        item_selector: str,
+        link_selector: Optional[str] = None,
+        date_selector: Optional[str] = None,
+        category_selector: Optional[str] = None,
+    ) -> List[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]]:
+        """
+        Read link, date and category data for every listing item in one round trip.
+
+        Values match get_href(link), get_element_text(link),
+        get_element_text(date_elem) and get_element_text(category_elem) for
+        the elements found inside each item. Items without a link are dropped.
+
+        Args:
+            item_selector: CSS selector for listing items
+            link_selector: Selector for the link inside an item (None = the item itself)
+            date_selector: Optional selector for the date element inside an item
+            category_selector: Optional selector for a category/tag element
+
+        Returns:
+            List of (href, text, date_text, category) tuples in document order
+        """
+        rows = await self.page.eval_on_selector_all(
+            item_selector,
+            _LISTING_ROWS_JS,
+            [link_selector, date_selector, category_selector],
+        )
+        return [
+            (
+                self._absolute_href(href.strip() if href else None),
+                text.strip() if text else None,
+                date_text.strip() if date_text else None,
+                category.strip() if category else None,
+            )
+            for href, text, date_text, category in rows
+        ]
+
+    async def get_links_with_context(
+        self, selector: str, context_selector: str
+    ) -> List[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """
+        Read every matched link with the text of its enclosing row in one round trip.
+
+        Values match get_href(link), get_element_text(link) and the
+        textContent of link.closest(context_selector).
+
+        Args:
+            selector: CSS selector for the links
+            context_selector: Selector for the ancestor whose text is returned
+                (e.g. ".views-row")
+
+        Returns:
+            List of (href, text, context_text or None) tuples in document order
+        """
+        rows = await self.page.eval_on_selector_all(selector, _LINK_CONTEXT_JS, context_selector)
+        return [
+            (
+                self._absolute_href(href.strip() if href else None),
+                text.strip() if text else None,
+                context,
+            )
+            for href, text, context in rows
+        ]
+
     async def get_element_text(self, element: ElementHandle) -> Optional[str]:
         """Safely extract text from an element."""
         try:
@@ -116,13 +357,28 @@ class BaseScraper(ABC):
 
     async def get_href(self, element: ElementHandle) -> Optional[str]:
         """Get href attribute from a link element."""
-        href = await self.get_attribute(element, "href")
+        return self._absolute_href(await self.get_attribute(element, "href"))
+
+    def _absolute_href(self, href: Optional[str]) -> Optional[str]:
+        """Resolve a relative href against BASE_URL."""
         if href and not href.startswith("http"):
             # Make relative URL absolute
             from urllib.parse import urljoin
             href = urljoin(self.BASE_URL, href)
         return href
 
+    @staticmethod
+    def url_key(url: str) -> Tuple[str, str, str]:
+        """
+        Canonical key for de-duplicating event URLs.
+
+        Ignores scheme, host case, a trailing slash and the fragment, so
+        "https://Site/event/x/" and "http://site/event/x#top" share a key.
+        The query string is kept since some sites identify events by it.
+        """
+        parts = urlsplit(url)
+        return parts.netloc.lower(), parts.path.rstrip("/"), parts.query
+
     def create_event(self, **kwargs) -> Event:
         """Factory method to create Event with source pre-filled."""
         return Event(source=self.SOURCE_NAME, **kwargs)
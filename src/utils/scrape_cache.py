@@ -0,0 +1,163 @@
+"""
+On-disk caches of per-source scrape results and per-URL detail-page events,
+with TTL-based invalidation.
+"""
+
+import logging
+import pickle
+import re
+import time
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional
+
+from src.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pickled Event layout changes so stale caches are ignored
+CACHE_VERSION = 2
+
+
+class ScrapeCache:
+    """Stores each source's scraped events as a pickle file."""
+
+    def __init__(self, directory: str = "cache", ttl: float = 3600):
+        """
+        Initialize scrape cache.
+
+        Args:
+            directory: Directory holding cache files
+            ttl: Maximum age of a cache entry in seconds
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, source_name: str) -> Path:
+        """Get the cache file path for a source."""
+        safe_name = re.sub(r"[^\w.-]+", "_", source_name).strip("_")
+        return self.directory / f"{safe_name}.pickle"
+
+    def get(self, source_name: str) -> Optional[List[Event]]:
+        """
+        Return cached events for a source, or None if missing or stale.
+
+        Args:
+            source_name: Source name from sources.yaml
+        """
+        path = self._path(source_name)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with path.open("rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache for {source_name}: {e}")
+            return None
+
+        if data.get("version") != CACHE_VERSION:
+            return None
+        return data["events"]
+
+    def put(self, source_name: str, events: List[Event]) -> None:
+        """
+        Write a source's events to the cache.
+
+        Args:
+            source_name: Source name from sources.yaml
+            events: Events scraped from the source
+        """
+        path = self._path(source_name)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("wb") as f:
+                pickle.dump(
+                    {"version": CACHE_VERSION, "events": events},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Could not write cache for {source_name}: {e}")
+
+
+class DetailPageCache:
+    """
+    Stores events parsed from individual detail pages, one pickle per source.
+
+    Entries are keyed by the listing data a detail page was scraped from
+    (URL plus listing title/date), so an unchanged listing entry skips the
+    page visit on later runs. Each entry expires on its own after ttl.
+    """
+
+    def __init__(self, directory: str = "cache", ttl: float = 86400):
+        """
+        Initialize detail-page cache.
+
+        Args:
+            directory: Directory holding cache files
+            ttl: Maximum age of a cache entry in seconds
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, source_name: str) -> Path:
+        """Get the cache file path for a source."""
+        safe_name = re.sub(r"[^\w.-]+", "_", source_name).strip("_")
+        return self.directory / f"{safe_name}.details.pickle"
+
+    def _load(self, source_name: str) -> Dict[Hashable, tuple]:
+        """Load a source's unexpired (timestamp, event) entries."""
+        path = self._path(source_name)
+        try:
+            with path.open("rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable detail cache for {source_name}: {e}")
+            return {}
+
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        cutoff = time.time() - self.ttl
+        return {
+            key: entry for key, entry in data["entries"].items() if entry[0] >= cutoff
+        }
+
+    def get(self, source_name: str) -> Dict[Hashable, Event]:
+        """
+        Return a source's unexpired cached events by key.
+
+        Args:
+            source_name: Source name from sources.yaml
+        """
+        return {key: event for key, (_, event) in self._load(source_name).items()}
+
+    def put(self, source_name: str, events: Dict[Hashable, Event]) -> None:
+        """
+        Add events to a source's cache, dropping expired entries.
+
+        Args:
+            source_name: Source name from sources.yaml
+            events: Newly scraped events by key
+        """
+        entries = self._load(source_name)
+        now = time.time()
+        entries.update((key, (now, event)) for key, event in events.items())
+
+        path = self._path(source_name)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("wb") as f:
+                pickle.dump(
+                    {"version": CACHE_VERSION, "entries": entries},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Could not write detail cache for {source_name}: {e}")
@@ -0,0 +1,56 @@
+"""
+Tests for Cambridge MRC BSU detail-page text extraction.
+"""
+
+import pytest
+
+from src.scrapers.academic.cambridge_mrc import CambridgeMRCScraper
+
+
+@pytest.fixture
+def scraper():
+    """Scraper instance; text extraction needs no page."""
+    return CambridgeMRCScraper(page=None)
+
+
+class TestExtractDetails:
+    """Tests for _extract_details."""
+
+    def test_european_date_time_and_speaker(self, scraper):
+        """Test the usual detail-page layout."""
+        text = "Speaker: Jane Doe\n14 January 2026, 14:00-15:00"
+
+        assert scraper._extract_details(text) == (
+            "14 January 2026",
+            "14:00-15:00",
+            ["Jane Doe"],
+        )
+
+    def test_speaker_before_us_date_keeps_date(self, scraper):
+        """Test that a speaker name does not swallow the month of a following date."""
+        text = "Speaker: John Smith\nJanuary 14, 2026\n14:00-15:00"
+
+        date_text, time_text, _ = scraper._extract_details(text)
+
+        assert date_text == "January 14, 2026"
+        assert time_text == "14:00-15:00"
+
+    def test_first_us_date_wins(self, scraper):
+        """Test that the first American date is kept when no European date exists."""
+        text = "Speaker: March Hare January 14, 2026 March 3 2026"
+
+        date_text, _, _ = scraper._extract_details(text)
+
+        assert date_text == "January 14, 2026"
+
+    def test_european_date_preferred(self, scraper):
+        """Test that a later European date beats an earlier American one."""
+        text = "Posted January 2, 2026. Seminar on 14 January 2026, 2pm-3pm."
+
+        assert scraper._extract_details(text) == ("14 January 2026", "", [])
+
+    def test_year_next_to_time_keeps_time(self, scraper):
+        """Test that a year directly before a clock time does not hide the time."""
+        text = "May 1 2012:00-13:00"
+
+        assert scraper._extract_details(text) == ("May 1 2012", "12:00-13:00", [])
@@ -80,6 +80,15 @@ class TestDateParserParseDatetimeRange:
         assert start_dt.hour == 9
         assert str(start_dt.tzinfo) == "America/Los_Angeles"
 
+    def test_time_on_dst_change_day_uses_that_times_offset(self):
+        """Test that noon on the spring-forward day stays noon (PDT, not PST)."""
+        text = "March 8, 2026 12:00-1:00pm PT"
+        start_dt, end_dt = DateParser.parse_datetime_range(text)
+
+        assert start_dt.hour == 12
+        assert end_dt.hour == 13
+        assert start_dt.utcoffset().total_seconds() == -7 * 3600
+
     def test_empty_text_raises_error(self):
         """Test that empty text raises ValueError."""
         with pytest.raises(ValueError, match="Empty date text"):
@@ -90,6 +99,11 @@ class TestDateParserParseDatetimeRange:
         with pytest.raises(ValueError):
             DateParser.parse_datetime_range("not a date at all xyz")
 
+    def test_text_without_digits_raises_error(self):
+        """Test that a bare month name is rejected rather than guessed."""
+        with pytest.raises(ValueError, match="No date digits"):
+            DateParser.parse_datetime_range("January PST")
+
     def test_abbreviated_month(self):
         """Test parsing abbreviated month name."""
         text = "Jan 28, 2026"
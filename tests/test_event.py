@@ -47,7 +47,7 @@ class TestEventCreation:
         )
 
         assert event.end_datetime == end_dt
-        assert event.speakers == ["John Doe", "Jane Smith"]
+        assert event.speakers == ("John Doe", "Jane Smith")
         assert event.location_type == LocationType.VIRTUAL
         assert event.cost == "free"
 
@@ -74,7 +74,7 @@ class TestEventCreation:
             speakers=["  John Doe  ", "Jane Smith", "  ", ""],
         )
 
-        assert event.speakers == ["John Doe", "Jane Smith"]
+        assert event.speakers == ("John Doe", "Jane Smith")
 
     def test_naive_datetime_localized_to_pst(self):
         """Test that naive datetime is localized to PST."""
@@ -292,6 +292,81 @@ class TestEventDateRange:
 
         assert event.is_within_date_range(start, end) is False
 
+    def test_event_within_timestamps(self):
+        """Test range check against precomputed epoch timestamps."""
+        event_dt = self.PST.localize(datetime(2026, 1, 15, 12, 0))
+        event = Event(
+            title="Test",
+            url="https://example.com",
+            source="Test",
+            start_datetime=event_dt,
+        )
+
+        start = self.PST.localize(datetime(2026, 1, 14, 0, 0)).timestamp()
+        end = self.PST.localize(datetime(2026, 1, 28, 23, 59)).timestamp()
+
+        assert event.start_ts == event_dt.timestamp()
+        assert event.is_within_timestamps(start, end) is True
+        assert event.is_within_timestamps(end, end + 60) is False
+
+
+class TestEventFingerprint:
+    """Tests for cross-source duplicate fingerprints."""
+
+    PST = pytz.timezone("America/Los_Angeles")
+
+    def test_same_event_from_two_sources_matches(self):
+        """Test that title case/whitespace and source do not affect the key."""
+        start_dt = self.PST.localize(datetime(2026, 1, 15, 12, 0))
+        event1 = Event(
+            title="Causal  Inference Webinar",
+            url="https://a.example.com",
+            source="A",
+            start_datetime=start_dt,
+        )
+        event2 = Event(
+            title="causal inference webinar",
+            url="https://b.example.com",
+            source="B",
+            start_datetime=start_dt,
+        )
+
+        assert event1.fingerprint() == event2.fingerprint()
+
+    def test_different_start_time_differs(self):
+        """Test that the same title on another day is not a duplicate."""
+        event1 = Event(
+            title="Monthly Seminar",
+            url="https://example.com/1",
+            source="A",
+            start_datetime=self.PST.localize(datetime(2026, 1, 15, 12, 0)),
+        )
+        event2 = Event(
+            title="Monthly Seminar",
+            url="https://example.com/2",
+            source="A",
+            start_datetime=self.PST.localize(datetime(2026, 2, 15, 12, 0)),
+        )
+
+        assert event1.fingerprint() != event2.fingerprint()
+
+    def test_fixed_bucket_not_sliding_window(self):
+        """Test that start times two minutes apart across a bucket edge differ."""
+        event1 = Event(
+            title="Monthly Seminar",
+            url="https://example.com/1",
+            source="A",
+            start_datetime=self.PST.localize(datetime(2026, 1, 15, 12, 29)),
+        )
+        event2 = Event(
+            title="Monthly Seminar",
+            url="https://example.com/2",
+            source="B",
+            start_datetime=self.PST.localize(datetime(2026, 1, 15, 12, 31)),
+        )
+
+        assert event1.fingerprint() != event2.fingerprint()
+
 
 class TestEventSorting:
     """Tests for Event sorting."""
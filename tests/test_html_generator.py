@@ -9,6 +9,8 @@ from pathlib import Path
 from datetime import datetime
 import pytz
 
+import src.main
+from src.main import EventScraperApp
 from src.output.html_generator import HTMLGenerator, days_to_time_period
 from src.models.event import Event, LocationType
 
@@ -328,6 +330,18 @@ class TestGenerateTextOutput:
         assert "one week" in result
 
 
+class TestGroupByDate:
+    """Tests for grouping events by day."""
+
+    def test_groups_sorted_events_by_day(self, html_generator, sample_events):
+        """Test that sorted events are grouped under their PST date."""
+        sorted_events = sorted(sample_events, key=lambda e: e.start_datetime)
+        grouped = html_generator._group_by_date(sorted_events)
+
+        assert list(grouped) == ["2026-01-14", "2026-01-15", "2026-01-16"]
+        assert grouped["2026-01-15"][0].title == "Test Seminar on Statistics"
+
+
 class TestDaysToTimePeriod:
     """Tests for days_to_time_period helper function."""
 
@@ -387,6 +401,32 @@ class TestExportPageTimePeriod:
             assert "two weeks" in content
 
 
+class TestGenerateStatusPage:
+    """Tests for the per-source status page."""
+
+    def test_status_page_shows_duplicates_removed(self, html_generator, tmp_path):
+        """Test that each source row includes its duplicates_removed count."""
+        source_results = [
+            {
+                "name": "TestOrg",
+                "url": "https://example.com",
+                "enabled": True,
+                "status": "success",
+                "total_events": 5,
+                "in_range_events": 4,
+                "duplicates_removed": 3,
+                "error_message": None,
+            }
+        ]
+        output_path = tmp_path / "status.html"
+
+        html_generator.generate_status_page(source_results, str(output_path))
+
+        content = output_path.read_text(encoding="utf-8")
+        assert "<th>Duplicates</th>" in content
+        assert '<td class="count-cell ">3</td>' in content
+
+
 class TestVercelAnalytics:
     """Tests for Vercel Web Analytics on generated HTML pages."""
 
@@ -438,3 +478,39 @@ class TestVercelAnalytics:
                 content = output_path.read_text(encoding="utf-8")
                 assert "window.va = window.va" in content
                 assert VERCEL_ANALYTICS_SCRIPT in content
+
+
+class TestParallelRender:
+    """Tests for rendering event pages in worker processes."""
+
+    GENERATED_AT = "2026-01-01 08:00:00 PST"
+
+    def test_worker_pages_share_generated_at(
+        self, sample_events, date_range, tmp_path, monkeypatch
+    ):
+        """Test that pages rendered in workers use the parent's timestamp."""
+
+        class FixedTimeGenerator(HTMLGenerator):
+            def __init__(self):
+                super().__init__()
+                self.generated_at = TestParallelRender.GENERATED_AT
+
+        monkeypatch.setattr(src.main, "HTMLGenerator", FixedTimeGenerator)
+
+        app = EventScraperApp.__new__(EventScraperApp)
+        app.config = {
+            "output": {
+                "directory": str(tmp_path),
+                "html_file": "events.html",
+                "parallel_render_threshold": 0,
+            }
+        }
+        app.all_sources = []
+        app.source_results = []
+
+        app._generate_output(sample_events, date_range)
+
+        assert (tmp_path / "export.html").exists()
+        for name in ("events.html", "status.html"):
+            content = (tmp_path / name).read_text(encoding="utf-8")
+            assert self.GENERATED_AT in content
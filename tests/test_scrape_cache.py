@@ -0,0 +1,241 @@
+"""
+Tests for the on-disk scrape caches.
+"""
+
+import os
+import pickle
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+
+import src.main
+from src.main import EventScraperApp
+from src.models.event import Event
+from src.scrapers.base import BaseScraper
+from src.utils import scrape_cache
+from src.utils.scrape_cache import DetailPageCache, ScrapeCache
+
+
+def make_event(title, pst_timezone):
+    """Build a minimal event for cache round-trips."""
+    return Event(
+        title=title,
+        url=f"https://example.com/{title.lower().replace(' ', '-')}",
+        source="TestOrg",
+        start_datetime=pst_timezone.localize(datetime(2026, 1, 15, 12, 0)),
+    )
+
+
+class TestScrapeCache:
+    """Tests for per-source ScrapeCache files."""
+
+    def test_round_trip(self, tmp_path, pst_timezone):
+        """Test that events put into the cache come back unchanged."""
+        cache = ScrapeCache(directory=str(tmp_path), ttl=3600)
+        events = [make_event("Seminar", pst_timezone)]
+
+        cache.put("Test Org / Seminars", events)
+
+        assert cache.get("Test Org / Seminars") == events
+        assert cache.get("Other Org") is None
+
+    def test_expired_entry_ignored(self, tmp_path, pst_timezone):
+        """Test that a cache file older than the TTL is treated as missing."""
+        cache = ScrapeCache(directory=str(tmp_path), ttl=3600)
+        cache.put("TestOrg", [make_event("Seminar", pst_timezone)])
+
+        stale = time.time() - 7200
+        os.utime(cache._path("TestOrg"), (stale, stale))
+
+        assert cache.get("TestOrg") is None
+
+    def test_version_mismatch_ignored(self, tmp_path, pst_timezone, monkeypatch):
+        """Test that a cache written under another CACHE_VERSION is ignored."""
+        cache = ScrapeCache(directory=str(tmp_path), ttl=3600)
+        cache.put("TestOrg", [make_event("Seminar", pst_timezone)])
+
+        monkeypatch.setattr(
+            scrape_cache, "CACHE_VERSION", scrape_cache.CACHE_VERSION + 1
+        )
+
+        assert cache.get("TestOrg") is None
+
+    def test_corrupt_file_returns_none(self, tmp_path):
+        """Test that an unreadable pickle is treated as missing."""
+        cache = ScrapeCache(directory=str(tmp_path), ttl=3600)
+        cache._path("TestOrg").write_bytes(b"not a pickle")
+
+        assert cache.get("TestOrg") is None
+
+    def test_put_writes_versioned_pickle(self, tmp_path, pst_timezone):
+        """Test the on-disk layout of a cache file."""
+        cache = ScrapeCache(directory=str(tmp_path / "nested"), ttl=3600)
+        cache.put("TestOrg", [make_event("Seminar", pst_timezone)])
+
+        with cache._path("TestOrg").open("rb") as f:
+            data = pickle.load(f)
+
+        assert data["version"] == scrape_cache.CACHE_VERSION
+        assert [e.title for e in data["events"]] == ["Seminar"]
+
+
+class TestScrapeSourceCache:
+    """Tests for cache use in EventScraperApp._scrape_source."""
+
+    @pytest.fixture
+    def app(self, tmp_path, pst_timezone, monkeypatch):
+        """App with a fake browser and scraper; scraped titles are recorded."""
+        scraped = []
+
+        class FakeScraper:
+            def __init__(self, page, detail_cache=None):
+                pass
+
+            async def scrape(self):
+                scraped.append("TestOrg")
+                return [make_event("Fresh", pst_timezone)]
+
+        class FakeBrowserManager:
+            @asynccontextmanager
+            async def new_page(self):
+                yield object()
+
+        monkeypatch.setattr(src.main, "get_scraper_class", lambda name: FakeScraper)
+
+        app = EventScraperApp.__new__(EventScraperApp)
+        app.cache = ScrapeCache(directory=str(tmp_path), ttl=3600)
+        app.detail_cache = None
+        app.browser_manager = FakeBrowserManager()
+        app.use_cache = True
+        app.scraped = scraped
+        app.cache.put("TestOrg", [make_event("Cached", pst_timezone)])
+        return app
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_scrape(self, app):
+        """Test that a fresh cache entry is returned without scraping."""
+        events = await app._scrape_source({"name": "TestOrg", "scraper": "fake"})
+
+        assert [e.title for e in events] == ["Cached"]
+        assert app.scraped == []
+
+    @pytest.mark.asyncio
+    async def test_no_cache_bypasses_and_refreshes(self, app):
+        """Test that --no-cache re-scrapes and overwrites the cached events."""
+        app.use_cache = False
+
+        events = await app._scrape_source({"name": "TestOrg", "scraper": "fake"})
+
+        assert [e.title for e in events] == ["Fresh"]
+        assert app.scraped == ["TestOrg"]
+        assert [e.title for e in app.cache.get("TestOrg")] == ["Fresh"]
+
+
+class FakePage:
+    """Stand-in for a pooled Playwright page."""
+
+    def is_closed(self):
+        return False
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    """Stand-in for a browser context that opens FakePages."""
+
+    async def new_page(self):
+        return FakePage()
+
+
+class ListingScraper(BaseScraper):
+    """Scraper exercising scrape_detail_pages with recorded page visits."""
+
+    SOURCE_NAME = "TestOrg"
+
+    def __init__(self, detail_cache, pst_timezone):
+        page = FakePage()
+        page.context = FakeContext()
+        super().__init__(page, detail_cache=detail_cache)
+        self.pst_timezone = pst_timezone
+        self.visited = []
+
+    async def scrape(self):
+        return []
+
+    async def scrape_one(self, page, item):
+        self.visited.append(item["url"])
+        return make_event(item["title"], self.pst_timezone)
+
+
+class TestDetailPageCache:
+    """Tests for per-entry DetailPageCache files."""
+
+    def test_put_merges_entries(self, tmp_path, pst_timezone):
+        """Test that put adds to a source's entries rather than replacing them."""
+        cache = DetailPageCache(directory=str(tmp_path), ttl=86400)
+
+        cache.put("TestOrg", {"a": make_event("First", pst_timezone)})
+        cache.put("TestOrg", {"b": make_event("Second", pst_timezone)})
+
+        cached = cache.get("TestOrg")
+        assert {key: e.title for key, e in cached.items()} == {
+            "a": "First",
+            "b": "Second",
+        }
+
+    def test_expired_entries_dropped_on_load(self, tmp_path, pst_timezone):
+        """Test that each entry expires on its own timestamp."""
+        cache = DetailPageCache(directory=str(tmp_path), ttl=3600)
+        now = time.time()
+        entries = {
+            "old": (now - 7200, make_event("Old", pst_timezone)),
+            "new": (now - 60, make_event("New", pst_timezone)),
+        }
+        with cache._path("TestOrg").open("wb") as f:
+            pickle.dump({"version": scrape_cache.CACHE_VERSION, "entries": entries}, f)
+
+        assert list(cache._load("TestOrg")) == ["new"]
+
+        cache.put("TestOrg", {})
+        with cache._path("TestOrg").open("rb") as f:
+            assert list(pickle.load(f)["entries"]) == ["new"]
+
+
+class TestScrapeDetailPages:
+    """Tests for BaseScraper.scrape_detail_pages cache reuse."""
+
+    ITEMS = [
+        {"url": "https://example.com/a", "title": "Seminar A"},
+        {"url": "https://example.com/b", "title": "Seminar B"},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_listing_entries_skip_visits(self, tmp_path, pst_timezone):
+        """Test that only new or changed listing entries are scraped again."""
+        cache = DetailPageCache(directory=str(tmp_path), ttl=86400)
+        first = ListingScraper(cache, pst_timezone)
+        await first.scrape_detail_pages(self.ITEMS, first.scrape_one)
+
+        changed = [
+            self.ITEMS[0],
+            {"url": "https://example.com/b", "title": "Seminar B (Rescheduled)"},
+        ]
+        second = ListingScraper(cache, pst_timezone)
+        events = await second.scrape_detail_pages(changed, second.scrape_one)
+
+        assert first.visited == ["https://example.com/a", "https://example.com/b"]
+        assert second.visited == ["https://example.com/b"]
+        assert [e.title for e in events] == ["Seminar A", "Seminar B (Rescheduled)"]
+
+    @pytest.mark.asyncio
+    async def test_without_cache_scrapes_every_item(self, pst_timezone):
+        """Test that a scraper with no detail cache visits every page."""
+        scraper = ListingScraper(None, pst_timezone)
+
+        events = await scraper.scrape_detail_pages(self.ITEMS, scraper.scrape_one)
+
+        assert scraper.visited == ["https://example.com/a", "https://example.com/b"]
+        assert [e.title for e in events] == ["Seminar A", "Seminar B"]